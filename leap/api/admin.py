@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from starlette.staticfiles import StaticFiles
 
 from leap.api.deps import get_db_session, get_experiment_info
 from leap.core import auth, storage
@@ -46,7 +47,7 @@ class ImportStudentsRequest(BaseModel):
 
 
 @router.post("/exp/{experiment}/admin/add-student")
-async def add_student(
+def add_student(
     body: AddStudentRequest,
     session: Session = Depends(get_db_session),
 ):
@@ -58,25 +59,26 @@ async def add_student(
 
 
 @router.get("/exp/{experiment}/admin/students")
-async def list_students(
+def list_students(
     session: Session = Depends(get_db_session),
 ):
     return {"students": storage.list_students(session)}
 
 
 @router.post("/exp/{experiment}/admin/delete-student")
-async def delete_student(
+def delete_student(
     body: DeleteStudentRequest,
+    exp_info: ExperimentInfo = Depends(get_experiment_info),
     session: Session = Depends(get_db_session),
 ):
-    deleted = storage.delete_student(session, body.student_id)
+    deleted = storage.delete_student(session, body.student_id, exp_info.db_path)
     if not deleted:
         raise HTTPException(404, detail=f"Student '{body.student_id}' not found")
     return {"ok": True, "student_id": body.student_id}
 
 
 @router.post("/exp/{experiment}/admin/import-students")
-async def import_students(
+def import_students(
     body: ImportStudentsRequest,
     session: Session = Depends(get_db_session),
 ):
@@ -85,7 +87,7 @@ async def import_students(
 
 
 @router.post("/exp/{experiment}/admin/delete-log")
-async def delete_log(
+def delete_log(
     body: DeleteLogRequest,
     session: Session = Depends(get_db_session),
 ):
@@ -96,7 +98,7 @@ async def delete_log(
 
 
 @router.post("/exp/{experiment}/admin/delete-logs")
-async def delete_logs(
+def delete_logs(
     body: DeleteLogsRequest,
     session: Session = Depends(get_db_session),
 ):
@@ -116,7 +118,7 @@ async def reload_experiment(
 
 
 @router.get("/exp/{experiment}/admin/export-logs")
-async def export_logs(
+def export_logs(
     session: Session = Depends(get_db_session),
     exp_info: ExperimentInfo = Depends(get_experiment_info),
     fmt: str = Query("jsonlines", alias="format"),
@@ -138,11 +140,12 @@ async def change_password(body: ChangePasswordRequest, request: Request):
     cred = auth.load_credentials(root)
     if not cred:
         raise HTTPException(500, detail="No admin credentials configured")
-    if not auth.verify_password(body.current_password, cred):
+    # PBKDF2 takes ~100s of ms each; keep both passes off the event loop
+    if not await asyncio.to_thread(auth.verify_password, body.current_password, cred):
         raise HTTPException(401, detail="Current password is incorrect")
     if not body.new_password.strip():
         raise HTTPException(400, detail="New password cannot be empty")
-    new_cred = auth.hash_password(body.new_password)
+    new_cred = await asyncio.to_thread(auth.hash_password, body.new_password)
     auth.save_credentials(new_cred, root)
     return {"ok": True}
 
@@ -159,9 +162,6 @@ async def rediscover_experiments(request: Request):
     # Add new experiments
     for name in added:
         current[name] = fresh[name]
-        if fresh[name].ui_dir.is_dir():
-            mount_path = f"/exp/{name}/ui"
-            request.app.mount(mount_path, StaticFiles(directory=str(fresh[name].ui_dir)), name=f"ui-{name}")
 
     # Remove deleted experiments
     for name in removed:
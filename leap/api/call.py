@@ -1,4 +1,4 @@
-"""POST /exp/{experiment}/call — RPC endpoint."""
+"""POST /exp/{experiment}/call and /call-batch — RPC endpoints."""
 
 from __future__ import annotations
 
@@ -6,11 +6,12 @@ import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from leap.api.deps import get_experiment_info
 from leap.core import rpc
 from leap.core.experiment import ExperimentInfo
+from leap.middleware.auth import is_admin
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,18 @@ class CallRequest(BaseModel):
     trial: str | None = None
 
 
+class BatchCall(BaseModel):
+    func_name: str
+    args: list | None = None
+    kwargs: dict | None = None
+
+
+class CallBatchRequest(BaseModel):
+    student_id: str
+    calls: list[BatchCall] = Field(max_length=rpc.MAX_BATCH_SIZE)
+    trial: str | None = None
+
+
 @router.post("/exp/{experiment}/call")
 async def call_function(
     body: CallRequest,
@@ -33,7 +46,7 @@ async def call_function(
 ):
     func = exp_info.functions.get(body.func_name)
     if func and getattr(func, "_leap_adminonly", False):
-        if not request.session.get("admin", False):
+        if not is_admin(request):
             raise HTTPException(403, detail="Admin access required")
     try:
         result = await asyncio.to_thread(
@@ -55,3 +68,28 @@ async def call_function(
     except RuntimeError as e:
         logger.exception("RPC call failed: %s.%s", exp_info.name, body.func_name)
         raise HTTPException(500, detail=str(e))
+
+
+@router.post("/exp/{experiment}/call-batch")
+async def call_batch(
+    body: CallBatchRequest,
+    request: Request,
+    exp_info: ExperimentInfo = Depends(get_experiment_info),
+):
+    """Run several calls in one request; results come back in call order."""
+    for call in body.calls:
+        func = exp_info.functions.get(call.func_name)
+        if func and getattr(func, "_leap_adminonly", False):
+            if not is_admin(request):
+                raise HTTPException(403, detail="Admin access required")
+    try:
+        results = await asyncio.to_thread(
+            rpc.execute_rpc_batch,
+            exp_info,
+            calls=[call.model_dump() for call in body.calls],
+            student_id=body.student_id,
+            trial=body.trial,
+        )
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
+    return {"results": results}
@@ -10,7 +10,6 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 
-from leap.core import storage
 from leap.core.experiment import ExperimentInfo
 
 limiter = Limiter(
@@ -20,16 +19,16 @@ limiter = Limiter(
 
 
 async def get_experiment_info(experiment: str, request: Request) -> ExperimentInfo:
-    experiments = request.app.state.experiments
-    if experiment not in experiments:
+    exp_info = request.app.state.experiments.get(experiment)
+    if exp_info is None:
         raise HTTPException(404, detail=f"Experiment '{experiment}' not found")
-    return experiments[experiment]
+    return exp_info
 
 
 def get_db_session(
     exp_info: ExperimentInfo = Depends(get_experiment_info),
 ) -> Generator[Session]:
-    session = storage.get_session(exp_info.name, exp_info.db_path)
+    session = exp_info.session_factory()
     try:
         yield session
     finally:
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -18,33 +22,36 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _count_students(exp: ExperimentInfo) -> int:
+    try:
+        session = exp.session_factory()
+        try:
+            return storage.count_students(session)
+        finally:
+            session.close()
+    except Exception:
+        logger.exception("Failed to count students for experiment '%s'", exp.name)
+        return 0
+
+
 @router.get("/api/experiments")
 async def list_experiments(request: Request):
-    experiments = request.app.state.experiments
+    experiments = list(request.app.state.experiments.values())
+    counts = await asyncio.gather(*(asyncio.to_thread(_count_students, exp) for exp in experiments))
     result = []
-    for exp in experiments.values():
+    for exp, count in zip(experiments, counts):
         meta = exp.to_metadata()
-        try:
-            session = storage.get_session(exp.name, exp.db_path)
-            try:
-                meta["student_count"] = storage.count_students(session)
-            finally:
-                session.close()
-        except Exception:
-            logger.exception("Failed to count students for experiment '%s'", exp.name)
-            meta["student_count"] = 0
+        meta["student_count"] = count
         result.append(meta)
     return {"experiments": result}
 
 
-@router.get("/api/health")
-async def health(request: Request):
-    experiments = getattr(request.app.state, "experiments", {})
+def _experiment_status(experiments: list[tuple[str, ExperimentInfo]]) -> tuple[bool, dict]:
     exp_status = {}
     all_ok = True
-    for name, exp in experiments.items():
+    for name, exp in experiments:
         try:
-            session = storage.get_session(exp.name, exp.db_path)
+            session = exp.session_factory()
             try:
                 exp_status[name] = {
                     "ok": True,
@@ -58,6 +65,14 @@ async def health(request: Request):
             logger.exception("Health check failed for experiment '%s'", name)
             all_ok = False
             exp_status[name] = {"ok": False, "error": "db_unreachable"}
+    return all_ok, exp_status
+
+
+@router.get("/api/health")
+async def health(request: Request):
+    experiments = getattr(request.app.state, "experiments", {})
+    # Counting queries block, so run them in a thread over a snapshot (rediscover mutates the dict)
+    all_ok, exp_status = await asyncio.to_thread(_experiment_status, list(experiments.items()))
     lab_info = getattr(request.app.state, "lab_info", {})
     return {
         "ok": all_ok,
@@ -72,7 +87,8 @@ async def health(request: Request):
 async def list_functions(
     exp_info: ExperimentInfo = Depends(get_experiment_info),
 ):
-    return exp_info.get_functions_info()
+    # Body is encoded once per reload_functions(), not per request
+    return Response(exp_info.functions_info_json(), media_type="application/json")
 
 
 @router.get("/exp/{experiment}/readme")
@@ -80,25 +96,37 @@ async def get_readme(
     exp_info: ExperimentInfo = Depends(get_experiment_info),
 ):
     try:
-        text = exp_info.readme_path.read_text(encoding="utf-8")
+        body = exp_info.readme_body()
     except OSError:
         raise HTTPException(404, detail="No README found for this experiment")
-    frontmatter = dict(exp_info.frontmatter)
-    body = text
-    if text.startswith("---"):
-        parts = text.split("---", 2)
-        if len(parts) >= 3:
-            body = parts[2].strip()
-    return {"frontmatter": frontmatter, "body": body}
+    return {"frontmatter": exp_info.frontmatter, "body": body}
+
+
+def _registration_etag(experiment: str, student_id: str, registered: bool) -> str:
+    digest = hashlib.sha1(f"{experiment}|{student_id}|{registered}".encode()).hexdigest()[:16]
+    return f'W/"reg-{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check: a comma-separated list, compared weakly (RFC 9110 13.1.2)."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
 
 
 @router.get("/exp/{experiment}/is-registered")
-async def is_registered(
+def is_registered(
+    request: Request,
     student_id: str = Query(...),
+    exp_info: ExperimentInfo = Depends(get_experiment_info),
     session: Session = Depends(get_db_session),
 ):
     registered = storage.is_registered(session, student_id)
-    return {"registered": registered}
+    # Clients revalidate with If-None-Match; an unchanged answer is an empty 304
+    etag = _registration_etag(exp_info.name, student_id, registered)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(orjson.dumps({"registered": registered}), media_type="application/json", headers=headers)
 
 
 class LoginRequest(BaseModel):
@@ -112,7 +140,8 @@ async def login(body: LoginRequest, request: Request):
     cred = auth.load_credentials(root)
     if not cred:
         raise HTTPException(500, detail="No admin credentials configured")
-    if not auth.verify_password(body.password, cred):
+    # PBKDF2 takes ~100s of ms; keep it off the event loop
+    if not await asyncio.to_thread(auth.verify_password, body.password, cred):
         raise HTTPException(401, detail="Invalid password")
     request.session["admin"] = True
     return {"ok": True}
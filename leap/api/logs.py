@@ -4,20 +4,26 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from leap.api.deps import get_db_session, get_experiment_info
+from leap.api.responses import ORJSONResponse
 from leap.core import storage
 from leap.core.experiment import ExperimentInfo
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 @router.get("/exp/{experiment}/logs")
-async def get_logs(
+def get_logs(
+    request: Request,
     exp_info: ExperimentInfo = Depends(get_experiment_info),
-    session: Session = Depends(get_db_session),
     sid: str | None = Query(None, alias="student_id"),
     trial: str | None = Query(None, alias="trial_name"),
     func_name: str | None = None,
@@ -30,8 +36,7 @@ async def get_logs(
     if func_name and func_name not in exp_info.functions:
         raise HTTPException(400, detail=f"Unknown function: '{func_name}'")
 
-    logs = storage.query_logs(
-        session,
+    filters = dict(
         student_id=sid,
         trial=trial,
         func_name=func_name,
@@ -41,11 +46,26 @@ async def get_logs(
         order=order,
         after_id=after_id,
     )
-    return {"logs": logs}
+
+    # Sessions come straight from the factory rather than get_db_session: the
+    # stream runs after yield-dependencies are torn down, so it needs its own.
+    # Opt-in streaming: one JSON object per line, read from the DB in chunks
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        def stream():
+            with exp_info.session_factory() as stream_session:
+                for log in storage.iter_logs(stream_session, raw_json=True, **filters):
+                    yield orjson.dumps(log) + b"\n"
+
+        return StreamingResponse(stream(), media_type=NDJSON_MEDIA_TYPE)
+
+    # Stored args/result JSON is spliced into the body as-is (raw_json), so the
+    # response is returned directly rather than through FastAPI's jsonable_encoder.
+    with exp_info.session_factory() as session:
+        return ORJSONResponse({"logs": storage.query_logs(session, raw_json=True, **filters)})
 
 
 @router.get("/exp/{experiment}/log-options")
-async def get_log_options(
+def get_log_options(
     session: Session = Depends(get_db_session),
 ):
     return storage.get_log_options(session)
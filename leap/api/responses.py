@@ -0,0 +1,22 @@
+"""orjson-backed JSON response used as the app-wide default response class."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that encodes with orjson (non-string dict keys allowed, like json.dumps).
+
+    Content orjson rejects (e.g. ints wider than 64 bits) falls back to the
+    stdlib encoder, so results stay exactly what JSONResponse would send.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().render(content)
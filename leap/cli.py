@@ -3,9 +3,7 @@
 from __future__ import annotations
 
 import contextlib
-import csv
-import io
-import json
+import functools
 import logging
 import os
 import re
@@ -14,14 +12,12 @@ import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
 
-import requests
 import typer
 import yaml
 
 from leap import __version__
-from leap.config import get_root, is_lab_root
+from leap.config import get_root, is_lab_root, load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +29,17 @@ REGISTRY_REPO = "leaplive/registry"
 # pip→import name mappings for dependency checking
 _IMPORT_MAP = {"pyyaml": "yaml", "pillow": "PIL", "scikit_learn": "sklearn"}
 
+_SLUG_SEPARATORS = str.maketrans("-_", "  ")
+
+# Static files scaffolded by `leap new`, pre-encoded.
+_REQUIREMENTS_STUB = b"# Add experiment dependencies here, one per line.\n"
+_FUNCTIONS_STUB = (
+    b'"""Experiment functions. Public callables are auto-discovered as RPC endpoints."""\n\n\n'
+    b"def hello(name: str = \"world\") -> str:\n"
+    b'    """Greet someone."""\n'
+    b'    return f"Hello, {name}!"\n'
+)
+
 
 def _slugify_dir(name: str) -> str:
     """Derive a slug from a directory name."""
@@ -41,7 +48,7 @@ def _slugify_dir(name: str) -> str:
 
 def _display_name_from_slug(name: str) -> str:
     """Convert a slug to a human-readable display name."""
-    return name.replace("-", " ").replace("_", " ").title()
+    return name.translate(_SLUG_SEPARATORS).title()
 
 
 def _parse_tags(raw: str) -> list[str]:
@@ -69,6 +76,7 @@ def _shorten_repo_url(url: str) -> str:
 def _print_validation_results(results: list[dict]) -> bool:
     """Print validation results with icons. Returns True if there were issues."""
     has_issues = False
+    lines: list[str] = []
     for r in results:
         if r["status"] == "ok":
             icon = "✓"
@@ -78,7 +86,9 @@ def _print_validation_results(results: list[dict]) -> bool:
         else:
             icon = "✗"
             has_issues = True
-        typer.echo(f"  {icon} {r['check']}: {r['message']}")
+        lines.append(f"  {icon} {r['check']}: {r['message']}")
+    if lines:
+        typer.echo("\n".join(lines))
     return has_issues
 
 
@@ -106,18 +116,19 @@ def _resolve_root(root: Path | None) -> Path:
 
 @contextlib.contextmanager
 def _experiment_session(experiment: str, root: Path | None = None):
-    """Open a DB session for an experiment, closing it on exit."""
-    from leap.core.experiment import ExperimentInfo
+    """Open a DB session for an experiment, closing it on exit.
+
+    Only the DB is touched: the experiment's README and functions are not loaded.
+    """
     from leap.core import storage
+    from leap.core.experiment import experiment_db_path
 
-    resolved = _resolve_root(root)
-    exp_path = resolved / "experiments" / experiment
+    exp_path = _resolve_root(root) / "experiments" / experiment
     if not exp_path.is_dir():
         raise typer.BadParameter(f"Experiment '{experiment}' not found at {exp_path}")
-    exp_info = ExperimentInfo(experiment, exp_path)
-    session = storage.get_session(experiment, exp_info.db_path)
+    session = storage.get_session_factory(experiment, experiment_db_path(exp_path))()
     try:
-        yield exp_info, session
+        yield session
     finally:
         session.close()
 
@@ -196,7 +207,7 @@ def add_student_fn(
     """Add a student to an experiment. Returns student dict."""
     from leap.core import storage
 
-    with _experiment_session(experiment, root) as (_exp_info, session):
+    with _experiment_session(experiment, root) as session:
         storage.add_student(session, student_id, name or student_id)
         return {"student_id": student_id, "name": name or student_id}
 
@@ -207,6 +218,8 @@ def import_students_fn(
     root: Path | None = None,
 ) -> dict:
     """Import students from a CSV file. Returns result dict with added/skipped/errors."""
+    import csv
+
     from leap.core import storage
 
     if not csv_file.is_file():
@@ -218,7 +231,7 @@ def import_students_fn(
             raise typer.BadParameter("CSV must have a 'student_id' column header")
         rows = list(reader)
 
-    with _experiment_session(experiment, root) as (_exp_info, session):
+    with _experiment_session(experiment, root) as session:
         return storage.bulk_add_students(session, rows)
 
 
@@ -226,7 +239,7 @@ def list_students_fn(experiment: str, root: Path | None = None) -> list[dict]:
     """List students in an experiment."""
     from leap.core import storage
 
-    with _experiment_session(experiment, root) as (_exp_info, session):
+    with _experiment_session(experiment, root) as session:
         return storage.list_students(session)
 
 
@@ -644,19 +657,8 @@ def new_experiment_fn(name: str, root: Path | None = None, interactive: bool = T
         encoding="utf-8",
     )
 
-    (exp_path / "requirements.txt").write_text(
-        "# Add experiment dependencies here, one per line.\n",
-        encoding="utf-8",
-    )
-
-    stub_func = exp_path / "funcs" / "functions.py"
-    stub_func.write_text(
-        '"""Experiment functions. Public callables are auto-discovered as RPC endpoints."""\n\n\n'
-        "def hello(name: str = \"world\") -> str:\n"
-        '    """Greet someone."""\n'
-        '    return f"Hello, {name}!"\n',
-        encoding="utf-8",
-    )
+    (exp_path / "requirements.txt").write_bytes(_REQUIREMENTS_STUB)
+    (exp_path / "funcs" / "functions.py").write_bytes(_FUNCTIONS_STUB)
 
     stub_ui = exp_path / "ui" / "dashboard.html"
     display = _display_name_from_slug(name)
@@ -733,10 +735,11 @@ def validate_experiment_fn(name: str, root: Path | None = None) -> list[dict]:
     results.append({"check": "directory", "status": "ok", "message": str(exp_path)})
 
     readme_path = exp_path / "README.md"
-    fm = parse_frontmatter(readme_path) if readme_path.is_file() else {}
+    fm: dict = {}
     if not readme_path.is_file():
         results.append({"check": "readme", "status": "warning", "message": "README.md missing"})
     else:
+        fm = parse_frontmatter(readme_path)
         results.append({"check": "readme", "status": "ok", "message": f"Frontmatter parsed: {list(fm.keys())}"})
 
     funcs_dir = exp_path / "funcs"
@@ -786,7 +789,8 @@ def show_config_fn(root: Path | None = None) -> dict:
     exp_dir = experiments_dir(resolved)
     exp_count = 0
     if exp_dir.is_dir():
-        exp_count = sum(1 for c in exp_dir.iterdir() if c.is_dir())
+        with os.scandir(exp_dir) as it:
+            exp_count = sum(1 for e in it if e.is_dir())
 
     return {
         "root": str(resolved),
@@ -846,6 +850,15 @@ def _doctor_row(check: str, status: str, message: str) -> dict:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _core_package_ok(pkg_name: str) -> bool:
+    """Whether a LEAP2 runtime dependency is importable; these can't vanish mid-process."""
+    import importlib.util
+
+    # find_spec locates the package without executing it (no heavy import graphs).
+    return importlib.util.find_spec(pkg_name) is not None
+
+
 def doctor_fn(root: Path | None = None) -> list[dict]:
     """Validate overall LEAP2 setup.
 
@@ -947,7 +960,8 @@ def doctor_fn(root: Path | None = None) -> list[dict]:
         results.append(_doctor_row("experiments_dir", "error", "experiments/ not found"))
 
     if exp_dir.is_dir():
-        exp_names = [c.name for c in sorted(exp_dir.iterdir()) if c.is_dir()]
+        with os.scandir(exp_dir) as it:
+            exp_names = sorted(e.name for e in it if e.is_dir())
         if exp_names:
             results.append(
                 _doctor_row("experiments", "ok", f"{len(exp_names)}: {', '.join(exp_names)}")
@@ -1075,10 +1089,9 @@ def doctor_fn(root: Path | None = None) -> list[dict]:
         )
 
     for pkg_name in ("fastapi", "uvicorn", "sqlalchemy", "duckdb", "typer"):
-        try:
-            __import__(pkg_name)
+        if _core_package_ok(pkg_name):
             results.append(_doctor_row(f"package:{pkg_name}", "ok", "importable"))
-        except ImportError:
+        else:
             results.append(_doctor_row(f"package:{pkg_name}", "error", "not installed"))
 
     return results
@@ -1089,39 +1102,63 @@ def export_logs_fn(
     fmt: str = "jsonlines",
     output: Path | None = None,
     root: Path | None = None,
+    batch_size: int = 5000,
 ) -> int:
-    """Export all logs for an experiment. Returns number of rows exported."""
-    from leap.core import storage
+    """Export all logs for an experiment over one streaming cursor. Returns number of rows exported."""
+    import csv
+    from itertools import islice
 
-    with _experiment_session(experiment, root) as (_exp_info, session):
-        all_logs = storage.query_all_logs(session)
+    import orjson
 
-    if not all_logs:
-        return 0
+    from leap.core import storage
 
-    if output:
-        fh = open(output, "w", encoding="utf-8", newline="")
-    else:
-        fh = sys.stdout
+    count = 0
 
-    try:
+    with _experiment_session(experiment, root) as session:
+        # raw_json: stored payloads are copied out verbatim (exact big ints, no re-encode)
+        rows = storage.iter_logs(session, n=None, order="earliest", yield_per=batch_size, raw_json=True)
+        page = list(islice(rows, batch_size))
+        if not page:
+            return 0
+
+        # CSV goes through the text layer; JSON lines are written as bytes.
         if fmt == "csv":
-            columns = ["id", "ts", "student_id", "experiment", "trial", "func_name", "args", "result", "error"]
-            writer = csv.DictWriter(fh, fieldnames=columns, extrasaction="ignore")
-            writer.writeheader()
-            for log in all_logs:
-                row = dict(log)
-                row["args"] = json.dumps(row.get("args"))
-                row["result"] = json.dumps(row.get("result"))
-                writer.writerow(row)
+            fh = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+        elif output:
+            fh = open(output, "wb")
         else:
-            for log in all_logs:
-                fh.write(json.dumps(log, default=str) + "\n")
-    finally:
-        if output and fh is not sys.stdout:
-            fh.close()
+            sys.stdout.flush()
+            fh = sys.stdout.buffer
 
-    return len(all_logs)
+        try:
+            if fmt == "csv":
+                columns = ["id", "ts", "student_id", "experiment", "trial", "func_name", "args", "result", "error"]
+                writer = csv.writer(fh)
+                writer.writerow(columns)
+
+            while page:
+                if fmt == "csv":
+                    writer.writerows(
+                        [
+                            log["id"], log["ts"], log["student_id"], log["experiment"], log["trial"],
+                            log["func_name"], orjson.dumps(log["args"]).decode(),
+                            orjson.dumps(log["result"]).decode(), log["error"],
+                        ]
+                        for log in page
+                    )
+                else:
+                    fh.write(b"".join(
+                        orjson.dumps(log, default=str, option=orjson.OPT_APPEND_NEWLINE) for log in page
+                    ))
+                count += len(page)
+                page = list(islice(rows, batch_size))
+        finally:
+            if output:
+                fh.close()
+            elif fh is not sys.stdout:
+                fh.flush()
+
+    return count
 
 
 def remove_experiment_fn(
@@ -1154,11 +1191,15 @@ def install_experiment_fn(
     url: str,
     name: str | None = None,
     root: Path | None = None,
+    depth: int = 1,
 ) -> tuple[str, Path, bool]:
     """Clone or update an experiment from a Git URL into experiments/.
 
+    New clones are shallow (``depth`` commits, single branch); pass depth=0 for full history.
     Returns (experiment_name, experiment_path, updated).
     """
+    from urllib.parse import urlparse
+
     from leap.core.experiment import validate_experiment_name
 
     resolved = _resolve_root(root)
@@ -1169,7 +1210,7 @@ def install_experiment_fn(
     if not name:
         parsed = urlparse(url)
         repo_name = parsed.path.rstrip("/").split("/")[-1]
-        repo_name = re.sub(r"\.git$", "", repo_name)
+        repo_name = repo_name.removesuffix(".git")
         name = repo_name.lower().replace(" ", "-")
 
     if not validate_experiment_name(name):
@@ -1210,10 +1251,12 @@ def install_experiment_fn(
         if parsed_url.scheme not in ("https", "http", "git", "ssh", ""):
             raise typer.BadParameter(f"Unsupported URL scheme: '{parsed_url.scheme}'")
 
+        shallow = ["--depth", str(depth), "--single-branch"] if depth > 0 else []
         try:
             subprocess.run(
-                ["git", "clone", url, str(dest)],
+                ["git", "clone", *shallow, url, str(dest)],
                 check=True,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
             )
@@ -1266,13 +1309,15 @@ def discover_registry_fn(
     organization: str | None = None,
 ) -> list[dict]:
     """Fetch the leaplive registry and return entries, optionally filtered."""
+    import requests
+
     try:
         response = requests.get(REGISTRY_URL, timeout=10)
         response.raise_for_status()
     except Exception as exc:
         raise typer.BadParameter(f"Failed to fetch registry: {exc}")
 
-    entries = yaml.safe_load(response.text)
+    entries = load_yaml(response.text)
     if not entries:
         return []
 
@@ -1759,10 +1804,9 @@ def list_students(
     if not students:
         typer.echo("No students registered.")
         return
-    typer.echo(f"{'Student ID':<20} {'Name':<30} {'Email'}")
-    typer.echo("-" * 70)
-    for s in students:
-        typer.echo(f"{s['student_id']:<20} {s['name']:<30} {s.get('email') or ''}")
+    lines = [f"{'Student ID':<20} {'Name':<30} {'Email'}", "-" * 70]
+    lines.extend(f"{s['student_id']:<20} {s['name']:<30} {s.get('email') or ''}" for s in students)
+    typer.echo("\n".join(lines))
 
 
 def _is_url(s: str) -> bool:
@@ -1879,6 +1923,7 @@ def add_experiment(
     name: Optional[str] = typer.Option(None, "--name", help="Override experiment name"),
     root: Optional[Path] = typer.Option(None, help="Project root override"),
     no_prompt: bool = typer.Option(False, "--no-prompt", help="Skip interactive prompts, use defaults"),
+    depth: int = typer.Option(1, "--depth", help="Commits of history to clone for Git URLs (0 = full history)"),
 ):
     """Add an experiment or lab — scaffold, clone from a Git URL, or copy from a local path."""
     # Normalize bare host URLs (e.g. github.com/owner/repo → https://github.com/owner/repo)
@@ -1887,7 +1932,7 @@ def add_experiment(
 
     if _is_url(name_or_url):
         try:
-            exp_name, exp_path, updated = install_experiment_fn(name_or_url, name, root)
+            exp_name, exp_path, updated = install_experiment_fn(name_or_url, name, root, depth=depth)
         except LabDetectedError as e:
             _handle_lab_add(e.url, e.name)
             return
@@ -1960,11 +2005,11 @@ def list_exps(
     if not exps:
         typer.echo("No experiments found.")
         return
-    typer.echo(f"{'Name':<20} {'Display Name':<25} {'Funcs':>5}  {'Registration'}")
-    typer.echo("-" * 75)
+    lines = [f"{'Name':<20} {'Display Name':<25} {'Funcs':>5}  {'Registration'}", "-" * 75]
     for e in exps:
         reg = "required" if e["require_registration"] else "open"
-        typer.echo(f"{e['name']:<20} {e['display_name']:<25} {e['functions']:>5}  {reg}")
+        lines.append(f"{e['name']:<20} {e['display_name']:<25} {e['functions']:>5}  {reg}")
+    typer.echo("\n".join(lines))
 
 
 @app.command("validate")
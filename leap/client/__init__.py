@@ -1,6 +1,7 @@
 """LEAP2 client library."""
 
 from leap.client.rpc import (
+    AsyncRPCClient,
     Client,
     RPCClient,
     RPCError,
@@ -14,6 +15,7 @@ from leap.client.logclient import LogClient
 __all__ = [
     "Client",
     "RPCClient",
+    "AsyncRPCClient",
     "RPCError",
     "RPCServerError",
     "RPCNetworkError",
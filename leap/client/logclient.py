@@ -7,13 +7,53 @@ Usage:
     logs = client.get_logs(student_id="s001", n=50)
     options = client.get_log_options()
     all_logs = client.get_all_logs(func_name="square")
+    for log in client.iter_all_logs(trial="run-1"):
+        ...
+    client.close()
+
+The client keeps a pooled HTTP session, so it can also be used as a context manager.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Server-side cap on ``n`` for /logs; also the default page size when paginating.
+MAX_PAGE_SIZE = 10_000
+
+
+def _log_params(
+    *,
+    student_id: str | None = None,
+    trial: str | None = None,
+    func_name: str | None = None,
+    start_time: str | None = None,
+    end_time: str | None = None,
+    n: int = 100,
+    order: str = "latest",
+    after_id: int | None = None,
+) -> dict[str, Any]:
+    """Map get_logs keyword args to /logs query params, omitting unset filters."""
+    params: dict[str, Any] = {"n": n, "order": order}
+    if student_id is not None:
+        params["student_id"] = student_id
+    if trial is not None:
+        params["trial_name"] = trial
+    if func_name is not None:
+        params["func_name"] = func_name
+    if start_time is not None:
+        params["start_time"] = start_time
+    if end_time is not None:
+        params["end_time"] = end_time
+    if after_id is not None:
+        params["after_id"] = after_id
+    return params
 
 
 class LogClient:
@@ -30,6 +70,31 @@ class LogClient:
         self.server_url = server_url.rstrip("/")
         self.experiment = experiment
         self._api_base = f"{self.server_url}/exp/{self.experiment}"
+        self._logs_url = f"{self._api_base}/logs"
+        self._log_options_url = f"{self._api_base}/log-options"
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> LogClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get_logs(
         self,
@@ -58,26 +123,17 @@ class LogClient:
         Returns:
             List of log entry dicts.
         """
-        params: dict[str, Any] = {}
-        if student_id is not None:
-            params["student_id"] = student_id
-        if trial is not None:
-            params["trial_name"] = trial
-        if func_name is not None:
-            params["func_name"] = func_name
-        if start_time is not None:
-            params["start_time"] = start_time
-        if end_time is not None:
-            params["end_time"] = end_time
-        if n != 100:
-            params["n"] = n
-        if order != "latest":
-            params["order"] = order
-        if after_id is not None:
-            params["after_id"] = after_id
-
-        data = self._get(f"{self._api_base}/logs", params=params)
-        return data["logs"]
+        params = _log_params(
+            student_id=student_id,
+            trial=trial,
+            func_name=func_name,
+            start_time=start_time,
+            end_time=end_time,
+            n=n,
+            order=order,
+            after_id=after_id,
+        )
+        return self._get(self._logs_url, params=params)["logs"]
 
     def get_log_options(self) -> dict[str, Any]:
         """Get filter options (students, trials) for the experiment.
@@ -85,43 +141,57 @@ class LogClient:
         Returns:
             Dict with "students" and "trials" lists.
         """
-        return self._get(f"{self._api_base}/log-options")
+        return self._get(self._log_options_url)
+
+    def iter_all_logs(self, *, page_size: int = MAX_PAGE_SIZE, **filter_kwargs) -> Iterator[dict[str, Any]]:
+        """Yield all logs matching filters, fetching one page at a time.
 
-    def get_all_logs(self, *, page_size: int = 1000, **filter_kwargs) -> list[dict[str, Any]]:
+        Like get_all_logs, but only about two pages are held in memory at once.
+
+        Args:
+            page_size: Results per page (default and maximum 10000).
+            **filter_kwargs: Same keyword args as get_logs (except after_id).
+
+        Yields:
+            Log entry dicts.
+        """
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        # Built once; only the cursor changes between pages.
+        params = _log_params(n=page_size, **filter_kwargs)
+
+        def fetch(after_id: int | None) -> list[dict[str, Any]]:
+            if after_id is not None:
+                params["after_id"] = after_id
+            return self._get(self._logs_url, params=params)["logs"]
+
+        # The cursor for page N+1 is known as soon as page N arrives, so the next
+        # request is issued while the caller consumes page N.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            logs = fetch(None)
+            while logs:
+                pending = pool.submit(fetch, logs[-1]["id"]) if len(logs) >= page_size else None
+                yield from logs
+                if pending is None:
+                    return
+                logs = pending.result()
+
+    def get_all_logs(self, *, page_size: int = MAX_PAGE_SIZE, **filter_kwargs) -> list[dict[str, Any]]:
         """Fetch all logs matching filters by auto-paginating with cursor.
 
         Iterates until a page returns fewer than page_size results.
 
         Args:
-            page_size: Results per page (default 1000).
+            page_size: Results per page (default and maximum 10000).
             **filter_kwargs: Same keyword args as get_logs (except after_id).
 
         Returns:
             List of all matching log entry dicts.
         """
-        all_logs: list[dict] = []
-        after_id = None
-        order = filter_kwargs.pop("order", "latest")
-
-        while True:
-            logs = self.get_logs(
-                n=page_size,
-                order=order,
-                after_id=after_id,
-                **filter_kwargs,
-            )
-            if not logs:
-                break
-            all_logs.extend(logs)
-            if len(logs) < page_size:
-                break
-            after_id = logs[-1]["id"]
-
-        return all_logs
+        return list(self.iter_all_logs(page_size=page_size, **filter_kwargs))
 
     def _get(self, url: str, params: dict | None = None) -> dict:
         try:
-            resp = requests.get(url, params=params, timeout=10)
+            resp = self._session.get(url, params=params, timeout=10)
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"LogClient: network error: {e}") from e
         if resp.status_code != 200:
@@ -4,9 +4,16 @@ from __future__ import annotations
 
 import json
 import os
+import re
+from collections.abc import Iterator
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+# Ask /logs for newline-delimited JSON (one log per line) instead of {"logs": [...]}
+_NDJSON_HEADERS = {"Accept": "application/x-ndjson"}
 
 
 class RPCError(Exception):
@@ -29,6 +36,80 @@ class RPCNotRegisteredError(RPCServerError):
     """Raised when the student_id is not registered (HTTP 403)."""
 
 
+# orjson turns ints outside [-2**63, 2**64) into floats. Those have at least
+# 19 digits, so bodies with a 19+ digit run go through the stdlib parser.
+_MAYBE_WIDE_INT = re.compile(rb"-?\d{19,}").search
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes with orjson, or json when they may hold wide ints.
+
+    Raises json.JSONDecodeError on bad input either way.
+    """
+    if _MAYBE_WIDE_INT(data) is None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _decode(resp) -> Any:
+    """Parse a JSON response body (raises json.JSONDecodeError on bad input)."""
+    return _loads(resp.content)
+
+
+def _logs_params(
+    n: int, student_id: str | None, func_name: str | None, trial: str | None, order: str
+) -> dict[str, Any]:
+    """Query params for /logs from the fetch_logs arguments."""
+    params: dict[str, Any] = {"n": n, "order": order}
+    if student_id:
+        params["student_id"] = student_id
+    if func_name:
+        params["func_name"] = func_name
+    if trial:
+        params["trial_name"] = trial
+    return params
+
+
+def _call_error(client, target: str, status: int, detail: str | None) -> RPCServerError:
+    """Build the exception for a failed call (HTTP status from the server)."""
+    if status == 403:
+        return RPCNotRegisteredError(
+            f"Student '{client.student_id}' is not registered. "
+            f"Register via the Admin UI ({client.server_url}/static/students.html"
+            f"?exp={client.experiment}) or the admin API."
+        )
+    return RPCServerError(
+        f"Server error calling {target}: {detail or 'unknown'} (HTTP {status})"
+    )
+
+
+def _batch_specs(calls: list[tuple]) -> list[dict[str, Any]]:
+    """Turn (func_name, args, kwargs) tuples into /call-batch call specs."""
+    specs = []
+    for name, *rest in calls:
+        spec: dict[str, Any] = {"func_name": name, "args": list(rest[0]) if rest else []}
+        if len(rest) > 1 and rest[1]:
+            spec["kwargs"] = rest[1]
+        specs.append(spec)
+    return specs
+
+
+def _batch_results(client, specs: list[dict], entries: list[dict], return_exceptions: bool) -> list[Any]:
+    """Unpack /call-batch entries into results, raising (or returning) per-call errors."""
+    if len(entries) != len(specs):
+        raise RPCProtocolError(f"Batch response has {len(entries)} results for {len(specs)} calls.")
+    results: list[Any] = []
+    for spec, entry in zip(specs, entries):
+        if "result" in entry:
+            results.append(entry["result"])
+            continue
+        exc = _call_error(client, f"'{spec['func_name']}'", entry.get("status", 500), entry.get("error"))
+        if not return_exceptions:
+            raise exc
+        results.append(exc)
+    return results
+
+
 
 class RPCClient:
     """Client for calling LEAP2 experiment functions via HTTP RPC.
@@ -51,6 +132,9 @@ class RPCClient:
 
         # Fetch your logs
         logs = client.fetch_logs(n=20)
+
+    The client keeps one pooled HTTP session for all calls; use it as a
+    context manager (or call ``close()``) to release the connections.
     """
 
     def __init__(
@@ -71,54 +155,84 @@ class RPCClient:
             )
 
         self._base = f"{self.server_url}/exp/{self.experiment}"
+        self._functions_url = f"{self._base}/functions"
+        self._call_url = f"{self._base}/call"
+        self._call_batch_url = f"{self._base}/call-batch"
+        self._is_registered_url = f"{self._base}/is-registered"
+        self._logs_url = f"{self._base}/logs"
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         self._functions: dict[str, dict] | None = None
+        # (ETag, registered) from the last /is-registered answer
+        self._registration: tuple[str, bool] | None = None
         self._discover()
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> RPCClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _discover(self):
-        """Fetch the list of available functions from the server."""
+        """Fetch the list of available functions from the server and bind them."""
         try:
-            resp = requests.get(f"{self._base}/functions", timeout=10)
+            resp = self._session.get(self._functions_url, timeout=10)
             resp.raise_for_status()
-            self._functions = resp.json()
+            self._functions = _decode(resp)
         except requests.exceptions.RequestException as e:
             raise RPCNetworkError(f"Error discovering functions: {e}") from e
+        for name, info in self._functions.items():
+            self._bind(name, info)
+
+    def _bind(self, name: str, info: dict):
+        """Attach ``client.<name>(...)`` for a remote function, unless it would shadow a client attribute."""
+        if hasattr(type(self), name) or name in self.__dict__:
+            return None
+        sig = info.get("signature", "(...)")
+        doc = info.get("doc", "")
+
+        def method(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = f"{name}{sig}\n\n{doc}" if doc else f"{name}{sig}"
+        self.__dict__[name] = method
+        return method
 
     def call(self, func_name: str, *args, **kwargs) -> Any:
         """Call a remote function by name."""
         payload: dict[str, Any] = {
             "student_id": self.student_id,
             "func_name": func_name,
-            "args": list(args),
+            "args": args,  # tuple; serialized as a JSON array
             "trial": self.trial_name,
         }
         if kwargs:
             payload["kwargs"] = kwargs
 
         try:
-            resp = requests.post(f"{self._base}/call", json=payload, timeout=15)
+            resp = self._session.post(self._call_url, json=payload, timeout=15)
         except requests.exceptions.RequestException as e:
             raise RPCNetworkError(f"Network error calling '{func_name}': {e}") from e
 
         if not resp.ok:
-            status = resp.status_code
             detail = None
             try:
-                detail = resp.json().get("detail")
+                detail = _decode(resp).get("detail")
             except (ValueError, json.JSONDecodeError):
                 detail = resp.text or resp.reason
-
-            if status == 403:
-                raise RPCNotRegisteredError(
-                    f"Student '{self.student_id}' is not registered. "
-                    f"Register via the Admin UI ({self.server_url}/static/students.html"
-                    f"?exp={self.experiment}) or the admin API."
-                )
-            raise RPCServerError(
-                f"Server error calling '{func_name}': {detail or 'unknown'} (HTTP {status})"
-            )
+            raise _call_error(self, f"'{func_name}'", resp.status_code, detail)
 
         try:
-            data = resp.json()
+            data = _decode(resp)
         except json.JSONDecodeError as e:
             raise RPCProtocolError(f"Invalid JSON response for '{func_name}': {e}") from e
 
@@ -127,19 +241,51 @@ class RPCClient:
 
         return data["result"]
 
-    def __getattr__(self, name: str):
-        if self._functions is not None and name in self._functions:
-            info = self._functions[name]
-            sig = info.get("signature", "(...)")
-            doc = info.get("doc", "")
+    def call_many(
+        self,
+        calls: list[tuple],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Call several remote functions in one HTTP request.
+
+        Args:
+            calls: ``(func_name, args, kwargs)`` tuples; args and kwargs may be
+                omitted. At most 1000 calls per request.
+            return_exceptions: If True, a failed call puts its exception in the
+                result list instead of raising.
+
+        Returns:
+            Results in the same order as ``calls``.
+        """
+        specs = _batch_specs(calls)
+        payload = {"student_id": self.student_id, "calls": specs, "trial": self.trial_name}
+
+        try:
+            resp = self._session.post(self._call_batch_url, json=payload, timeout=60)
+        except requests.exceptions.RequestException as e:
+            raise RPCNetworkError(f"Network error calling batch: {e}") from e
+
+        if not resp.ok:
+            detail = None
+            try:
+                detail = _decode(resp).get("detail")
+            except (ValueError, json.JSONDecodeError):
+                detail = resp.text or resp.reason
+            raise _call_error(self, "batch", resp.status_code, detail)
 
-            def method(*args, **kwargs):
-                return self.call(name, *args, **kwargs)
+        try:
+            entries = _decode(resp)["results"]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise RPCProtocolError(f"Invalid batch response: {e}") from e
+        return _batch_results(self, specs, entries, return_exceptions)
 
-            method.__name__ = name
-            method.__doc__ = f"{name}{sig}\n\n{doc}" if doc else f"{name}{sig}"
-            setattr(self, name, method)
-            return method
+    def __getattr__(self, name: str):
+        # Discovered functions are bound in _discover; this only sees misses.
+        functions = self.__dict__.get("_functions")
+        if functions is not None and name in functions:
+            method = self._bind(name, functions[name])
+            if method is not None:
+                return method
         raise AttributeError(
             f"No function '{name}' in experiment '{self.experiment}'. "
             f"Use client.help() to see available functions."
@@ -172,24 +318,50 @@ class RPCClient:
                     print(f"      {line}")
             print()
 
-    def is_registered(self) -> bool:
+    def is_registered(self, probe: bool = False) -> bool:
         """Check whether this client's student_id is registered.
 
         Uses the ``/exp/{experiment}/is-registered`` endpoint (no side effects).
-        Falls back to probing a function call if the endpoint is unavailable.
+        Re-checks send the previous ETag, so an unchanged answer is an empty 304.
+
+        Args:
+            probe: If the endpoint is unavailable (older servers), fall back to
+                calling a function to find out. That runs experiment code and
+                may add a log entry, so it is off by default.
+
+        Raises:
+            RPCNetworkError: The server could not be reached.
+            RPCError: The endpoint is unavailable and ``probe`` is False.
         """
+        headers = {"If-None-Match": self._registration[0]} if self._registration else None
         try:
-            resp = requests.get(
-                f"{self._base}/is-registered",
+            resp = self._session.get(
+                self._is_registered_url,
                 params={"student_id": self.student_id},
+                headers=headers,
                 timeout=5,
             )
-            if resp.ok:
-                data = resp.json()
-                if isinstance(data, dict) and "registered" in data:
-                    return bool(data["registered"])
-        except requests.exceptions.RequestException:
-            pass
+        except requests.exceptions.RequestException as e:
+            raise RPCNetworkError(f"Network error checking registration: {e}") from e
+
+        if resp.status_code == 304 and self._registration:
+            return self._registration[1]
+        if resp.ok:
+            try:
+                data = _decode(resp)
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and "registered" in data:
+                registered = bool(data["registered"])
+                etag = resp.headers.get("ETag")
+                self._registration = (etag, registered) if etag else None
+                return registered
+
+        if not probe:
+            raise RPCError(
+                f"Cannot determine registration: /is-registered unavailable "
+                f"(HTTP {resp.status_code}). Pass probe=True to fall back to a test call."
+            )
 
         # Fallback: probe via a real call (may produce one log entry)
         candidates = self._build_probe_candidates()
@@ -258,20 +430,224 @@ class RPCClient:
             A list of log dicts with keys: id, ts, student_id, func_name,
             trial, args, result, error.
         """
-        params: dict[str, Any] = {"n": n, "order": order}
-        if student_id:
-            params["student_id"] = student_id
-        if func_name:
-            params["func_name"] = func_name
-        if trial:
-            params["trial_name"] = trial
+        params = _logs_params(n, student_id, func_name, trial, order)
+        try:
+            resp = self._session.get(self._logs_url, params=params, timeout=10)
+        except requests.exceptions.RequestException as e:
+            raise RPCNetworkError(f"Network error fetching logs: {e}") from e
+
+        self._check_logs_response(resp, student_id)
 
         try:
-            resp = requests.get(f"{self._base}/logs", params=params, timeout=10)
+            data = _decode(resp)
+        except json.JSONDecodeError as e:
+            raise RPCProtocolError(f"Invalid JSON response from /logs: {e}") from e
+
+        return data.get("logs", [])
+
+    def iter_logs(
+        self,
+        n: int = 100,
+        student_id: str | None = None,
+        func_name: str | None = None,
+        trial: str | None = None,
+        order: str = "latest",
+    ) -> Iterator[dict]:
+        """Like fetch_logs, but streams the response and yields each log as it arrives.
+
+        The server sends newline-delimited JSON, so neither side holds all
+        ``n`` logs in memory at once.
+        """
+        params = _logs_params(n, student_id, func_name, trial, order)
+        try:
+            resp = self._session.get(
+                self._logs_url, params=params, headers=_NDJSON_HEADERS, stream=True, timeout=10
+            )
         except requests.exceptions.RequestException as e:
             raise RPCNetworkError(f"Network error fetching logs: {e}") from e
 
-        if not resp.ok:
+        try:
+            self._check_logs_response(resp, student_id)
+            for line in resp.iter_lines():
+                if line:
+                    yield _loads(line)
+        except requests.exceptions.RequestException as e:
+            raise RPCNetworkError(f"Network error fetching logs: {e}") from e
+        except json.JSONDecodeError as e:
+            raise RPCProtocolError(f"Invalid NDJSON line from /logs: {e}") from e
+        finally:
+            resp.close()
+
+    def _check_logs_response(self, resp, student_id: str | None) -> None:
+        if resp.ok:
+            return
+        if resp.status_code == 403:
+            raise RPCNotRegisteredError(
+                f"Student '{student_id or self.student_id}' is not registered."
+            )
+        raise RPCServerError(f"Server error fetching logs: HTTP {resp.status_code}")
+
+
+class AsyncRPCClient:
+    """Asyncio client for concurrent RPC fan-out. Requires httpx (``pip install leaplive[async]``).
+
+    Usage::
+
+        async with AsyncRPCClient("http://localhost:9000", student_id="s001",
+                                  experiment="default") as client:
+            results = await asyncio.gather(*(client.call("square", x) for x in range(100)))
+            results = await client.call_many([("square", (x,)) for x in range(100)])
+
+    All calls share one pooled ``httpx.AsyncClient`` (at most ``max_connections``
+    sockets), so hundreds of in-flight calls need no extra threads. With
+    ``http2=True`` (``pip install leaplive[http2]``) concurrent calls are
+    multiplexed over a single connection to HTTP/2-capable servers or proxies.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        student_id: str,
+        experiment: str | None = None,
+        trial_name: str | None = None,
+        max_connections: int = 32,
+        http2: bool = False,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncRPCClient requires httpx: pip install 'leaplive[async]'"
+            ) from e
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "AsyncRPCClient(http2=True) requires h2: pip install 'leaplive[http2]'"
+                ) from e
+
+        self.server_url = server_url.rstrip("/")
+        self.student_id = student_id
+        self.trial_name = trial_name
+
+        self.experiment = experiment or os.environ.get("DEFAULT_EXPERIMENT")
+        if not self.experiment:
+            raise ValueError(
+                "experiment must be provided or DEFAULT_EXPERIMENT env must be set"
+            )
+
+        self._base = f"{self.server_url}/exp/{self.experiment}"
+        self._functions_url = f"{self._base}/functions"
+        self._call_url = f"{self._base}/call"
+        self._call_batch_url = f"{self._base}/call-batch"
+        self._is_registered_url = f"{self._base}/is-registered"
+        self._logs_url = f"{self._base}/logs"
+
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=15,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30,
+            ),
+        )
+        self._functions: dict[str, dict] | None = None
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncRPCClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, what: str, **kwargs):
+        try:
+            return await self._client.request(method, url, **kwargs)
+        except self._httpx.HTTPError as e:
+            raise RPCNetworkError(f"Network error {what}: {e}") from e
+
+    @staticmethod
+    def _detail(resp) -> str | None:
+        try:
+            return _decode(resp).get("detail")
+        except ValueError:
+            return resp.text or resp.reason_phrase
+
+    async def list_functions(self) -> dict[str, dict]:
+        """Return discovered functions with signatures and docs (fetched once)."""
+        if self._functions is None:
+            resp = await self._request("GET", self._functions_url, "discovering functions", timeout=10)
+            if not resp.is_success:
+                raise RPCNetworkError(f"Error discovering functions: HTTP {resp.status_code}")
+            self._functions = _decode(resp)
+        return self._functions
+
+    async def call(self, func_name: str, *args, **kwargs) -> Any:
+        """Call a remote function by name."""
+        payload: dict[str, Any] = {
+            "student_id": self.student_id,
+            "func_name": func_name,
+            "args": args,  # tuple; serialized as a JSON array
+            "trial": self.trial_name,
+        }
+        if kwargs:
+            payload["kwargs"] = kwargs
+
+        resp = await self._request("POST", self._call_url, f"calling '{func_name}'", json=payload)
+        if not resp.is_success:
+            raise _call_error(self, f"'{func_name}'", resp.status_code, self._detail(resp))
+
+        try:
+            data = _decode(resp)
+        except ValueError as e:
+            raise RPCProtocolError(f"Invalid JSON response for '{func_name}': {e}") from e
+        if "result" not in data:
+            raise RPCProtocolError(f"Missing 'result' in server response for '{func_name}'.")
+        return data["result"]
+
+    async def call_many(self, calls: list[tuple], return_exceptions: bool = False) -> list[Any]:
+        """Call several remote functions in one HTTP request; see RPCClient.call_many."""
+        specs = _batch_specs(calls)
+        payload = {"student_id": self.student_id, "calls": specs, "trial": self.trial_name}
+
+        resp = await self._request("POST", self._call_batch_url, "calling batch", json=payload, timeout=60)
+        if not resp.is_success:
+            raise _call_error(self, "batch", resp.status_code, self._detail(resp))
+
+        try:
+            entries = _decode(resp)["results"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise RPCProtocolError(f"Invalid batch response: {e}") from e
+        return _batch_results(self, specs, entries, return_exceptions)
+
+    async def is_registered(self) -> bool:
+        """Check whether this client's student_id is registered (``/is-registered``)."""
+        resp = await self._request(
+            "GET", self._is_registered_url, "checking registration",
+            params={"student_id": self.student_id}, timeout=5,
+        )
+        if not resp.is_success:
+            raise RPCServerError(f"Server error checking registration: HTTP {resp.status_code}")
+        return bool(_decode(resp).get("registered"))
+
+    async def fetch_logs(
+        self,
+        n: int = 100,
+        student_id: str | None = None,
+        func_name: str | None = None,
+        trial: str | None = None,
+        order: str = "latest",
+    ) -> list[dict]:
+        """Fetch call logs for this experiment; see RPCClient.fetch_logs."""
+        params = _logs_params(n, student_id, func_name, trial, order)
+        resp = await self._request("GET", self._logs_url, "fetching logs", params=params, timeout=10)
+        if not resp.is_success:
             if resp.status_code == 403:
                 raise RPCNotRegisteredError(
                     f"Student '{student_id or self.student_id}' is not registered."
@@ -279,10 +655,9 @@ class RPCClient:
             raise RPCServerError(f"Server error fetching logs: HTTP {resp.status_code}")
 
         try:
-            data = resp.json()
-        except json.JSONDecodeError as e:
+            data = _decode(resp)
+        except ValueError as e:
             raise RPCProtocolError(f"Invalid JSON response from /logs: {e}") from e
-
         return data.get("logs", [])
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import logging
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -17,7 +18,16 @@ logging.basicConfig(
 )
 
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _PROJECT_ROOT_TYPES = ("lab",)
+_PACKAGE_UI_DIR = Path(__file__).resolve().parent / "ui"
+
+
+def load_yaml(text: str) -> Any:
+    """yaml.safe_load, using the C loader when available."""
+    return yaml.load(text, Loader=_YAML_LOADER)
 
 
 def parse_frontmatter_text(text: str, defaults: dict | None = None) -> dict:
@@ -29,7 +39,7 @@ def parse_frontmatter_text(text: str, defaults: dict | None = None) -> dict:
     if end == -1:
         return result
     try:
-        fm = yaml.safe_load(text[3:end]) or {}
+        fm = load_yaml(text[3:end]) or {}
     except yaml.YAMLError:
         return result
     result.update(fm)
@@ -84,7 +94,7 @@ def credentials_path(root: Path | None = None) -> Path:
 
 def package_ui_dir() -> Path:
     """Return the path to UI files bundled with the leap package."""
-    return Path(__file__).resolve().parent / "ui"
+    return _PACKAGE_UI_DIR
 
 
 def ui_dir(root: Path | None = None) -> Path:
@@ -13,7 +13,28 @@ from leap.config import credentials_path, config_dir, ADMIN_PASSWORD_ENV
 
 logger = logging.getLogger(__name__)
 
-ITERATIONS = 240_000
+DEFAULT_ITERATIONS = 240000
+
+
+def _iterations_from_env() -> int:
+    raw = os.environ.get("LEAP_PBKDF2_ITERATIONS", "")
+    if not raw.strip():
+        return DEFAULT_ITERATIONS
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(
+            "Ignoring LEAP_PBKDF2_ITERATIONS=%r (expected a positive integer); using %d",
+            raw, DEFAULT_ITERATIONS,
+        )
+        return DEFAULT_ITERATIONS
+    return value
+
+
+# Used for new hashes only; verification reads the count stored with each credential.
+ITERATIONS = _iterations_from_env()
 ALGORITHM = "pbkdf2_sha256"
 
 
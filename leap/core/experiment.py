@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import importlib.util
 import inspect
 import logging
@@ -12,14 +14,16 @@ import types
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 
 from leap import __version__
-from leap.config import experiments_dir, parse_frontmatter_text
+from leap.config import experiments_dir, load_yaml, parse_frontmatter_text
+from leap.core import storage
 
 logger = logging.getLogger(__name__)
 
-VALID_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+VALID_NAME_RE = re.compile(r"\A[a-z0-9][a-z0-9_-]*\Z")
 
 # Sentinel entry_point meaning "open the experiment README page" (/static/readme.html?exp=...)
 ENTRY_POINT_README = "readme"
@@ -85,16 +89,41 @@ def check_leap_version(required: str) -> tuple[bool, str]:
 
 
 def validate_experiment_name(name: str) -> bool:
-    return bool(VALID_NAME_RE.match(name))
+    return VALID_NAME_RE.match(name) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_readme(path_str: str, mtime_ns: int, size: int) -> tuple[dict, str]:
+    """(frontmatter, body) for a README; mtime_ns/size make edits miss the cache."""
+    text = Path(path_str).read_text(encoding="utf-8")
+    return parse_frontmatter_text(text, DEFAULT_FRONTMATTER), _readme_body(text)
+
+
+def _read_readme_cached(readme_path: Path) -> tuple[dict, str]:
+    """Cached (frontmatter, body); the frontmatter is a deep copy callers may mutate.
+
+    Raises OSError if the README is missing or unreadable.
+    """
+    st = readme_path.stat()
+    fm, body = _read_readme(str(readme_path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(fm), body
 
 
 def parse_frontmatter(readme_path: Path) -> dict:
-    """Parse YAML frontmatter from a README.md file."""
+    """Parse YAML frontmatter from a README.md file (cached until the file changes)."""
     try:
-        text = readme_path.read_text(encoding="utf-8")
+        return _read_readme_cached(readme_path)[0]
     except OSError:
-        return dict(DEFAULT_FRONTMATTER)
-    return parse_frontmatter_text(text, DEFAULT_FRONTMATTER)
+        return copy.deepcopy(DEFAULT_FRONTMATTER)
+
+
+def _readme_body(text: str) -> str:
+    """Strip a leading ``---`` frontmatter block from README text."""
+    if text.startswith("---"):
+        parts = text.split("---", 2)
+        if len(parts) >= 3:
+            return parts[2].strip()
+    return text
 
 
 def update_frontmatter_field(readme_path: Path, field: str, value: Any) -> bool:
@@ -112,7 +141,7 @@ def update_frontmatter_field(readme_path: Path, field: str, value: Any) -> bool:
         return False
 
     try:
-        parsed = yaml.safe_load(text[3:end]) or {}
+        parsed = load_yaml(text[3:end]) or {}
     except yaml.YAMLError:
         return False
 
@@ -163,6 +192,22 @@ def remove_experiment_entry(readme_path: Path, name: str) -> bool:
     return update_frontmatter_field(readme_path, "experiments", new_entries)
 
 
+def _load_module(py_file: Path) -> types.ModuleType | None:
+    """Import one functions file under a per-experiment module name; None on failure."""
+    module_name = f"_leap_funcs_{py_file.parent.parent.name}_{py_file.stem}"
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, py_file)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    except Exception:
+        logger.exception("Failed to load %s", py_file)
+        return None
+    return module
+
+
 def load_functions(funcs_dir: Path) -> dict[str, callable]:
     """Load all public callables from *.py files in funcs_dir."""
     functions: dict[str, callable] = {}
@@ -174,25 +219,18 @@ def load_functions(funcs_dir: Path) -> dict[str, callable]:
         sys.path.insert(0, parent_str)
 
     for py_file in sorted(funcs_dir.glob("*.py")):
-        module_name = f"_leap_funcs_{funcs_dir.parent.name}_{py_file.stem}"
-        try:
-            spec = importlib.util.spec_from_file_location(module_name, py_file)
-            if spec is None or spec.loader is None:
-                continue
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-        except Exception:
-            logger.exception("Failed to load %s", py_file)
+        module = _load_module(py_file)
+        if module is None:
             continue
+        module_name = module.__name__
 
-        exported = getattr(module, "__all__", None)
-        names = exported if exported is not None else dir(module)
-        for attr_name in names:
+        namespace = vars(module)
+        exported = namespace.get("__all__")
+        for attr_name in exported if exported is not None else list(namespace):
             if attr_name.startswith("_"):
                 continue
-            obj = getattr(module, attr_name)
-            if callable(obj) and not isinstance(obj, type) and not isinstance(obj, types.ModuleType):
+            obj = namespace.get(attr_name)
+            if callable(obj) and not isinstance(obj, (type, types.ModuleType)):
                 # Skip imports — only export functions defined in this module
                 if exported is None and getattr(obj, "__module__", None) != module_name:
                     continue
@@ -223,6 +261,11 @@ def get_function_info(func: callable) -> dict[str, str]:
     }
 
 
+def experiment_db_path(path: Path) -> Path:
+    """Location of the DuckDB file for the experiment directory at path."""
+    return path / "db" / "experiment.db"
+
+
 class ExperimentInfo:
     """Holds loaded experiment state."""
 
@@ -232,7 +275,7 @@ class ExperimentInfo:
         self.readme_path = path / "README.md"
         self.funcs_dir = path / "funcs"
         self.ui_dir = path / "ui"
-        self.db_path = path / "db" / "experiment.db"
+        self.db_path = experiment_db_path(path)
 
         self.frontmatter = parse_frontmatter(self.readme_path)
         self._apply_frontmatter()
@@ -243,6 +286,8 @@ class ExperimentInfo:
             )
 
         self.functions: dict[str, callable] = {}
+        self._functions_info: dict[str, dict] | None = None
+        self._functions_info_json: bytes | None = None
         self.reload_functions()
 
     def _apply_frontmatter(self):
@@ -252,6 +297,10 @@ class ExperimentInfo:
         self.description = fm.get("description", "")
         self.version = fm.get("version", "")
         self.entry_point = fm.get("entry_point", ENTRY_POINT_README)
+        if self.entry_point == ENTRY_POINT_README:
+            self.entry_url = f"/static/readme.html?exp={self.name}"
+        else:
+            self.entry_url = f"/exp/{self.name}/ui/{self.entry_point}"
         self.require_registration = fm.get("require_registration", True)
         self.leap_version = fm.get("leap_version", "")
         self.pages = fm.get("pages", [])
@@ -267,12 +316,36 @@ class ExperimentInfo:
         self._apply_frontmatter()
         return self.frontmatter
 
+    def readme_body(self) -> str:
+        """README text without frontmatter, from the same cache as parse_frontmatter.
+
+        Raises OSError if the README is missing or unreadable.
+        """
+        st = self.readme_path.stat()
+        return _read_readme(str(self.readme_path), st.st_mtime_ns, st.st_size)[1]
+
+    @property
+    def session_factory(self):
+        """Cached sessionmaker for this experiment's DB (engine built on first use)."""
+        return storage.get_session_factory(self.name, self.db_path)
+
     def reload_functions(self) -> int:
         self.functions = load_functions(self.funcs_dir)
+        self._functions_info = None
+        self._functions_info_json = None
         return len(self.functions)
 
     def get_functions_info(self) -> dict[str, dict]:
-        return {name: get_function_info(fn) for name, fn in self.functions.items()}
+        """Signature/doc/flag payload for all functions, built once per reload."""
+        if self._functions_info is None:
+            self._functions_info = {name: get_function_info(fn) for name, fn in self.functions.items()}
+        return self._functions_info
+
+    def functions_info_json(self) -> bytes:
+        """get_functions_info() pre-encoded as JSON, cached alongside it."""
+        if self._functions_info_json is None:
+            self._functions_info_json = orjson.dumps(self.get_functions_info())
+        return self._functions_info_json
 
     def to_metadata(self) -> dict[str, Any]:
         return {
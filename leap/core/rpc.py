@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import contextvars
+import functools
 import logging
 import os
 import re
+import threading
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
@@ -15,10 +17,12 @@ from leap.core import storage
 
 logger = logging.getLogger(__name__)
 
-STUDENT_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{1,255}$")
+STUDENT_ID_RE = re.compile(r"\A[a-zA-Z0-9_-]{1,255}\Z")
 
 DEFAULT_RATE_LIMIT = "120/minute"
 
+MAX_BATCH_SIZE = 1000
+
 
 def ratelimit(limit):
     """Decorator: set per-student rate limit. Pass a string like "10/minute" or False to disable."""
@@ -37,6 +41,7 @@ _PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
 _parsed_limits: dict[str, tuple[int, int]] = {}
 _SWEEP_INTERVAL = 300  # seconds between stale key sweeps
 _last_sweep: float = 0.0
+_rate_lock = threading.Lock()  # RPCs run in worker threads; windows are read-modify-write
 
 
 def _parse_limit(limit_str: str) -> tuple[int, int]:
@@ -52,23 +57,24 @@ def _parse_limit(limit_str: str) -> tuple[int, int]:
 def _check_rate_limit(key: tuple, limit_str: str) -> bool:
     global _last_sweep
     max_calls, window = _parse_limit(limit_str)
-    now = time.monotonic()
-
-    # Periodic sweep of stale keys
-    if now - _last_sweep > _SWEEP_INTERVAL:
-        _last_sweep = now
-        stale = [k for k, ts in _rate_windows.items() if not ts or ts[-1] < now - window]
-        for k in stale:
-            del _rate_windows[k]
-
-    timestamps = _rate_windows[key]
-    cutoff = now - window
-    while timestamps and timestamps[0] <= cutoff:
-        timestamps.popleft()
-    if len(timestamps) >= max_calls:
-        return False
-    timestamps.append(now)
-    return True
+    with _rate_lock:
+        now = time.monotonic()
+
+        # Periodic sweep of stale keys
+        if now - _last_sweep > _SWEEP_INTERVAL:
+            _last_sweep = now
+            stale = [k for k, ts in _rate_windows.items() if not ts or ts[-1] < now - window]
+            for k in stale:
+                del _rate_windows[k]
+
+        timestamps = _rate_windows[key]
+        cutoff = now - window
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        if len(timestamps) >= max_calls:
+            return False
+        timestamps.append(now)
+        return True
 
 
 def nolog(func):
@@ -119,8 +125,9 @@ def _has_flag(func, flag: str) -> bool:
     return getattr(func, flag, False)
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_student_id(student_id: str) -> bool:
-    return bool(STUDENT_ID_RE.match(student_id))
+    return STUDENT_ID_RE.match(student_id) is not None
 
 
 def is_lightweight(func, experiment) -> bool:
@@ -150,66 +157,112 @@ def execute_rpc(
     if not validate_student_id(student_id):
         raise ValueError(f"Invalid student_id: '{student_id}'")
 
-    # Lazy DB session — only create when the function actually needs it
     skip_regcheck = _has_flag(func, "_leap_noregcheck")
     skip_log = _has_flag(func, "_leap_nolog")
-    needs_db = (
-        (not skip_regcheck and experiment.require_registration)
-        or not skip_log
-    )
-    own_session = False
-    if needs_db and session is None:
-        session = storage.get_session(experiment.name, experiment.db_path)
-        own_session = True
 
-    try:
-        if not skip_regcheck and experiment.require_registration:
-            if not storage.is_registered(session, student_id):
-                raise PermissionError(f"Student '{student_id}' is not registered")
-
-        env_limit = os.environ.get("LEAP_RATE_LIMIT")
-        if env_limit != "0":
-            limit_val = getattr(func, "_leap_ratelimit", "default")
-            if limit_val == "default":
-                limit_val = DEFAULT_RATE_LIMIT
-            if limit_val:
-                key = (experiment.name, func_name, student_id)
-                if not _check_rate_limit(key, limit_val):
-                    raise RateLimitError(f"Rate limit exceeded for '{func_name}': {limit_val}")
-
-        args = args or []
-        kwargs = kwargs or {}
-        error_msg = None
-        result = None
-
-        if _has_flag(func, "_leap_withctx"):
-            _ctx_var.set(Context(student_id=student_id, trial=trial, experiment=experiment.name))
+    # Without a caller session, the registration check is served from a short-lived
+    # cache and log rows go through the experiment's group-commit writer.
+    if not skip_regcheck and experiment.require_registration:
+        if session is not None:
+            registered = storage.is_registered(session, student_id)
+        else:
+            registered = storage.is_registered_cached(experiment.name, experiment.db_path, student_id)
+        if not registered:
+            raise PermissionError(f"Student '{student_id}' is not registered")
+
+    env_limit = os.environ.get("LEAP_RATE_LIMIT")
+    if env_limit != "0":
+        limit_val = getattr(func, "_leap_ratelimit", "default")
+        if limit_val == "default":
+            limit_val = DEFAULT_RATE_LIMIT
+        if limit_val:
+            key = (experiment.name, func_name, student_id)
+            if not _check_rate_limit(key, limit_val):
+                raise RateLimitError(f"Rate limit exceeded for '{func_name}': {limit_val}")
+
+    args = args or []
+    kwargs = kwargs or {}
+    error_msg = None
+    result = None
+
+    if _has_flag(func, "_leap_withctx"):
+        _ctx_var.set(Context(student_id=student_id, trial=trial, experiment=experiment.name))
 
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        error_msg = f"{type(e).__name__}: {e}"
+        logger.exception("RPC %s.%s raised: %s", experiment.name, func_name, error_msg)
+
+    if not skip_log:
+        fields = dict(
+            student_id=student_id,
+            experiment=experiment.name,
+            func_name=func_name,
+            args=args,
+            result=result,
+            error=error_msg,
+            trial=trial,
+        )
         try:
-            result = func(*args, **kwargs)
-        except Exception as e:
-            error_msg = f"{type(e).__name__}: {e}"
-            logger.exception("RPC %s.%s raised: %s", experiment.name, func_name, error_msg)
-
-        if not skip_log:
-            try:
-                storage.add_log(
-                    session,
-                    student_id=student_id,
-                    experiment=experiment.name,
-                    func_name=func_name,
-                    args=args,
-                    result=result,
-                    error=error_msg,
-                    trial=trial,
+            if session is not None:
+                storage.add_log(session, **fields)
+            else:
+                storage.submit_log(
+                    experiment.name, experiment.db_path,
+                    wait=os.environ.get("LEAP_ASYNC_LOGS") != "1", **fields,
                 )
-            except Exception:
-                logger.exception("Failed to log RPC call %s.%s", experiment.name, func_name)
+        except Exception:
+            logger.exception("Failed to log RPC call %s.%s", experiment.name, func_name)
+
+    if error_msg:
+        raise RuntimeError(error_msg)
+
+    return result
 
-        if error_msg:
-            raise RuntimeError(error_msg)
 
-        return result
-    finally:
-        if own_session and session is not None:
-            session.close()
+def _error_status(exc: Exception) -> int:
+    """HTTP status the /call endpoint would use for an execute_rpc exception."""
+    if isinstance(exc, RateLimitError):
+        return 429
+    if isinstance(exc, ValueError):
+        return 400
+    if isinstance(exc, PermissionError):
+        return 403
+    return 500
+
+
+def execute_rpc_batch(
+    experiment,  # ExperimentInfo
+    session=None,
+    *,
+    calls: list[dict],
+    student_id: str,
+    trial: str | None = None,
+) -> list[dict]:
+    """Execute calls in order for one student. Returns one entry per call.
+
+    Each call is a dict with func_name and optional args/kwargs. Each entry is
+    {"result": ...} on success or {"error": str, "status": int} on failure;
+    one failing call does not stop the rest.
+    """
+    if len(calls) > MAX_BATCH_SIZE:
+        raise ValueError(f"Batch too large: {len(calls)} calls (max {MAX_BATCH_SIZE})")
+
+    results: list[dict] = []
+    for call in calls:
+        try:
+            result = execute_rpc(
+                experiment,
+                session,
+                func_name=call["func_name"],
+                args=call.get("args"),
+                kwargs=call.get("kwargs"),
+                student_id=student_id,
+                trial=trial,
+            )
+        except (ValueError, PermissionError, RateLimitError, RuntimeError) as e:
+            results.append({"error": str(e), "status": _error_status(e)})
+        else:
+            results.append({"result": result})
+    return results
@@ -2,32 +2,62 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import re
 import secrets
+import shutil
+import tempfile
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException as StarletteHTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response
 from starlette.middleware.sessions import SessionMiddleware
-from starlette.staticfiles import StaticFiles
 
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from leap import __version__
 from leap.api.deps import limiter
+from leap.api.responses import ORJSONResponse
+from leap.api.staticfiles import ExperimentUIFiles, StaticFiles, compressible_files, precompress
 from leap.config import get_root, ui_dir, package_ui_dir, SESSION_SECRET_KEY, DEFAULT_EXPERIMENT
 from leap.core.auth import ensure_credentials
-from leap.core.experiment import discover_experiments, parse_frontmatter, ENTRY_POINT_README
+from leap.core.experiment import discover_experiments, parse_frontmatter
 from leap.api import call, logs, admin, experiments
 from leap.core import storage
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded fallback bodies; scanners hit the 404 paths often
+_NOT_FOUND_JSON = b'{"detail":"Not found"}'
+_NOT_FOUND_HTML = "<h1>404 — Not Found</h1>".encode()
+_NO_LANDING_JSON = b'{"message":"LEAP2 is running. No landing page found."}'
+# /api/* and /exp/* (except experiment UI pages) get JSON 404s
+_JSON_404_PATH = re.compile(r"/api/|/exp(?!.*/ui/)/", re.S).match
+# One random fallback key per process, shared by every create_app() call
+_SESSION_SECRET = SESSION_SECRET_KEY or secrets.token_hex(32)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_origins(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated CORS_ORIGINS value."""
+    return tuple(o.strip() for o in raw.split(",") if o.strip())
+
+
+def _first_file(roots: list[Path], rel: str) -> Path | None:
+    """First roots[i] / rel that exists as a file, else None."""
+    for ui_root in roots:
+        candidate = ui_root / rel
+        if candidate.is_file():
+            return candidate
+    return None
+
 
 def create_app(root=None) -> FastAPI:
     @asynccontextmanager
@@ -40,20 +70,25 @@ def create_app(root=None) -> FastAPI:
 
         exps = discover_experiments(resolved_root)
         app.state.experiments = exps
-        logger.info("Loaded %d experiment(s): %s", len(exps), ", ".join(exps.keys()) or "(none)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Loaded %d experiment(s): %s", len(exps), ", ".join(exps) or "(none)")
 
         pkg_ui = package_ui_dir()
         pkg_shared = pkg_ui / "shared"
+        # gzip twins of the shared assets live in a per-process temp dir, never
+        # in the (possibly read-only) package directory
+        gz_cache = None
         if pkg_shared.is_dir():
-            app.mount("/static", StaticFiles(directory=str(pkg_shared)), name="static-assets")
+            if compressible_files(pkg_shared):
+                gz_cache = tempfile.mkdtemp(prefix="leap-static-")
+                precompress(pkg_shared, gz_cache)
+            app.mount(
+                "/static",
+                StaticFiles(directory=str(pkg_shared), precompressed=gz_cache),
+                name="static-assets",
+            )
             logger.info("Mounted /static -> %s", pkg_shared)
 
-        for exp_name, exp_info in exps.items():
-            if exp_info.ui_dir.is_dir():
-                mount_path = f"/exp/{exp_name}/ui"
-                app.mount(mount_path, StaticFiles(directory=str(exp_info.ui_dir)), name=f"ui-{exp_name}")
-                logger.info("Mounted %s -> %s", mount_path, exp_info.ui_dir)
-
         assets_dir = resolved_root / "assets"
         if assets_dir.is_dir():
             app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="project-assets")
@@ -72,23 +107,35 @@ def create_app(root=None) -> FastAPI:
 
         app.state.ui_root = ui_dir(resolved_root)
         app.state.pkg_ui_root = pkg_ui
-        yield
-        storage.close_all_engines()
-
-    app = FastAPI(title="LEAP2", version=__version__, lifespan=lifespan)
+        # Resolved once: project UI overrides the packaged one
+        ui_roots = [app.state.ui_root, pkg_ui]
+        app.state.landing_file = _first_file(ui_roots, "landing/index.html")
+        page_404 = _first_file(ui_roots, "404.html")
+        app.state.page_404_bytes = page_404.read_bytes() if page_404 is not None else None
+        try:
+            yield
+        finally:
+            storage.close_all_engines()
+            if gz_cache is not None:
+                shutil.rmtree(gz_cache, ignore_errors=True)
+
+    app = FastAPI(
+        title="LEAP2",
+        version=__version__,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-    secret = SESSION_SECRET_KEY or secrets.token_hex(32)
-    app.add_middleware(SessionMiddleware, secret_key=secret, max_age=86400, same_site="strict")
+    app.add_middleware(SessionMiddleware, secret_key=_SESSION_SECRET, max_age=86400, same_site="strict")
 
-    cors_origins = os.environ.get("CORS_ORIGINS", "")
-    if cors_origins:
-        origins = [o.strip() for o in cors_origins.split(",") if o.strip()]
+    origins = _parse_origins(os.environ.get("CORS_ORIGINS", ""))
+    if origins:
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=origins,
+            allow_origins=list(origins),
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
@@ -98,24 +145,20 @@ def create_app(root=None) -> FastAPI:
     app.include_router(logs.router)
     app.include_router(admin.router)
     app.include_router(experiments.router)
+    # After the API routes, so /exp/{experiment}/... endpoints match first
+    app.mount("/exp/{experiment}/ui", ExperimentUIFiles(), name="experiment-ui")
 
     @app.get("/", include_in_schema=False)
     async def landing(request: Request):
-        exps = getattr(request.app.state, "experiments", {})
-        if DEFAULT_EXPERIMENT and DEFAULT_EXPERIMENT in exps:
-            entry = exps[DEFAULT_EXPERIMENT].entry_point
-            if entry == ENTRY_POINT_README:
-                url = f"/static/readme.html?exp={DEFAULT_EXPERIMENT}"
-            else:
-                url = f"/exp/{DEFAULT_EXPERIMENT}/ui/{entry}"
-            return RedirectResponse(url=url, status_code=307)
+        if DEFAULT_EXPERIMENT:
+            exp_info = getattr(request.app.state, "experiments", {}).get(DEFAULT_EXPERIMENT)
+            if exp_info is not None:
+                return RedirectResponse(url=exp_info.entry_url, status_code=307)
 
-        for ui_root in [getattr(request.app.state, "ui_root", Path()),
-                        getattr(request.app.state, "pkg_ui_root", Path())]:
-            landing_file = ui_root / "landing" / "index.html"
-            if landing_file.is_file():
-                return FileResponse(str(landing_file), media_type="text/html")
-        return {"message": "LEAP2 is running. No landing page found."}
+        landing_file = getattr(request.app.state, "landing_file", None)
+        if landing_file is not None:
+            return FileResponse(landing_file, media_type="text/html")
+        return Response(_NO_LANDING_JSON, media_type="application/json")
 
     @app.get("/login", include_in_schema=False)
     async def login_page(request: Request):
@@ -124,19 +167,15 @@ def create_app(root=None) -> FastAPI:
 
     @app.exception_handler(404)
     async def not_found_handler(request: Request, exc: StarletteHTTPException):
-        if request.url.path.startswith("/api/") or (request.url.path.startswith("/exp/") and "/ui/" not in request.url.path):
+        if _JSON_404_PATH(request.url.path):
             detail = getattr(exc, "detail", None)
             if isinstance(detail, str) and detail.strip():
-                msg = detail
+                body = orjson.dumps({"detail": detail})
             else:
-                msg = "Not found"
-            return JSONResponse(status_code=404, content={"detail": msg})
-        for ui_root in [getattr(request.app.state, "ui_root", Path()),
-                        getattr(request.app.state, "pkg_ui_root", Path())]:
-            page_404 = ui_root / "404.html"
-            if page_404.is_file():
-                return FileResponse(str(page_404), status_code=404, media_type="text/html")
-        return HTMLResponse("<h1>404 — Not Found</h1>", status_code=404)
+                body = _NOT_FOUND_JSON
+            return Response(body, status_code=404, media_type="application/json")
+        page_404 = getattr(request.app.state, "page_404_bytes", None)
+        return HTMLResponse(page_404 if page_404 is not None else _NOT_FOUND_HTML, status_code=404)
 
     return app
 
@@ -5,9 +5,18 @@ from __future__ import annotations
 from fastapi import Request, HTTPException, status
 
 
+def is_admin(request: Request) -> bool:
+    """Return the session's admin flag, memoised on ``request.state``."""
+    flag = getattr(request.state, "admin", None)
+    if flag is None:
+        flag = bool(request.session.get("admin"))
+        request.state.admin = flag
+    return flag
+
+
 async def require_admin(request: Request) -> None:
     """Dependency that checks for an authenticated admin session."""
-    if not request.session.get("admin"):
+    if not is_admin(request):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Admin login required",
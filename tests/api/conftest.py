@@ -0,0 +1,44 @@
+"""API test fixtures: one app per test module, reset between tests."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+from leap.main import create_app
+from leap.core import storage
+
+
+@pytest.fixture(scope="module")
+def _shared_client(module_credentials: Path):
+    app = create_app(root=module_credentials)
+    with TestClient(app) as c:
+        yield c
+    storage.close_all_engines()
+
+
+@pytest.fixture
+def client(_shared_client: TestClient, module_credentials: Path, test_cred: dict):
+    """The module's app, reset to no session, no students, no logs, original password."""
+    storage.flush_logs()
+    for exp_info in _shared_client.app.state.experiments.values():
+        with storage.get_session(exp_info.name, exp_info.db_path) as session:
+            for student in storage.list_students(session):
+                storage.delete_student(session, student["student_id"], exp_info.db_path)
+            session.execute(delete(storage.Log))
+            session.commit()
+    (module_credentials / "config" / "admin_credentials.json").write_text(json.dumps(test_cred))
+    _shared_client.cookies.clear()
+    return _shared_client
+
+
+@pytest.fixture
+def admin_client(client: TestClient):
+    """Client with admin session."""
+    resp = client.post("/login", json={"password": "testpass"})
+    assert resp.status_code == 200
+    return client
@@ -4,29 +4,6 @@ from __future__ import annotations
 
 import json
 import time
-from pathlib import Path
-
-import pytest
-from fastapi.testclient import TestClient
-
-from leap.main import create_app
-from leap.core import storage
-
-
-@pytest.fixture
-def client(tmp_credentials: Path):
-    app = create_app(root=tmp_credentials)
-    with TestClient(app) as c:
-        yield c
-    storage.close_all_engines()
-
-
-@pytest.fixture
-def admin_client(client: TestClient):
-    """Client with admin session."""
-    resp = client.post("/login", json={"password": "testpass"})
-    assert resp.status_code == 200
-    return client
 
 
 def _register_student(admin_client, exp="default", sid="s001", name="Alice"):
@@ -45,6 +22,25 @@ def _call_func(client, exp="default", sid="s001", func="square", args=None, tria
     return client.post(f"/exp/{exp}/call", json=body)
 
 
+def _register_students(admin_client, n, exp="default"):
+    """Register s000..s{n-1} with one import-students request."""
+    resp = admin_client.post(f"/exp/{exp}/admin/import-students", json={
+        "students": [{"student_id": f"s{i:03d}", "name": f"Student {i}"} for i in range(n)],
+    })
+    assert resp.status_code == 200
+    return resp
+
+
+def _call_many(client, n, exp="default", sid="s001", func="square"):
+    """Make n logged calls (args 0..n-1) with one call-batch request."""
+    resp = client.post(f"/exp/{exp}/call-batch", json={
+        "student_id": sid,
+        "calls": [{"func_name": func, "args": [i]} for i in range(n)],
+    })
+    assert resp.status_code == 200
+    return resp
+
+
 # ── Health & Metadata ──
 
 
@@ -156,6 +152,13 @@ class TestAuth:
         resp = admin_client.get("/exp/default/admin/students")
         assert resp.status_code == 401
 
+    def test_tampered_session_cookie_rejected(self, admin_client):
+        cookie = admin_client.cookies["session"]
+        payload, ts, sig = cookie.split(".")
+        forged = sig[:-1] + ("A" if sig[-1] != "A" else "B")
+        admin_client.cookies.set("session", f"{payload}.{ts}.{forged}")
+        assert admin_client.get("/api/auth-status").json()["admin"] is False
+
     def test_auth_status_not_logged_in(self, client):
         resp = client.get("/api/auth-status")
         assert resp.status_code == 200
@@ -203,8 +206,7 @@ class TestStudentAdmin:
         assert students[0]["email"] == "alice@u.edu"
 
     def test_add_multiple_students(self, admin_client):
-        for i in range(5):
-            _register_student(admin_client, sid=f"s{i:03d}", name=f"Student {i}")
+        _register_students(admin_client, 5)
         students = admin_client.get("/exp/default/admin/students").json()["students"]
         assert len(students) == 5
 
@@ -318,6 +320,27 @@ class TestIsRegistered:
         resp = admin_client.get("/exp/default/is-registered", params={"student_id": "s001"})
         assert resp.json()["registered"] is False
 
+    def test_etag_revalidation(self, admin_client):
+        url = "/exp/default/is-registered"
+        etag = admin_client.get(url, params={"student_id": "s001"}).headers["etag"]
+        resp = admin_client.get(url, params={"student_id": "s001"}, headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        _register_student(admin_client)
+        resp = admin_client.get(url, params={"student_id": "s001"}, headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["registered"] is True
+        assert resp.headers["etag"] != etag
+
+    def test_etag_revalidation_list_and_weak(self, admin_client):
+        url = "/exp/default/is-registered"
+        etag = admin_client.get(url, params={"student_id": "s001"}).headers["etag"]
+        strong = etag.removeprefix("W/")
+        for header in (f'"other", {etag}', f'W/"other",{strong}', "*"):
+            resp = admin_client.get(url, params={"student_id": "s001"}, headers={"If-None-Match": header})
+            assert resp.status_code == 304, header
+        resp = admin_client.get(url, params={"student_id": "s001"}, headers={"If-None-Match": '"other", W/"x"'})
+        assert resp.status_code == 200
+
 
 # ── RPC Calls ──
 
@@ -370,6 +393,36 @@ class TestRPC:
             assert resp.status_code == 200
             assert resp.json()["result"] == i * i
 
+    def test_call_big_int_result(self, admin_client):
+        _register_student(admin_client)
+        resp = _call_func(admin_client, args=[3**45])
+        assert resp.status_code == 200
+        assert resp.json()["result"] == 3**90
+
+    def test_call_batch(self, admin_client):
+        _register_student(admin_client)
+        resp = admin_client.post("/exp/default/call-batch", json={
+            "student_id": "s001",
+            "calls": [
+                {"func_name": "square", "args": [3]},
+                {"func_name": "add", "args": [1, 2]},
+                {"func_name": "nope"},
+            ],
+            "trial": "batch-1",
+        })
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert results[0] == {"result": 9}
+        assert results[1] == {"result": 3}
+        assert results[2]["status"] == 400
+        logs = admin_client.get("/exp/default/logs", params={"trial": "batch-1"}).json()["logs"]
+        assert len(logs) == 2
+
+    def test_call_batch_too_large(self, client):
+        calls = [{"func_name": "square", "args": [1]}] * 1001
+        resp = client.post("/exp/default/call-batch", json={"student_id": "s001", "calls": calls})
+        assert resp.status_code == 422
+
 
 # ── Logs API ──
 
@@ -438,8 +491,7 @@ class TestLogs:
 
     def test_log_order_latest(self, admin_client):
         _register_student(admin_client)
-        for i in range(5):
-            _call_func(admin_client, args=[i])
+        _call_many(admin_client, 5)
         resp = admin_client.get("/exp/default/logs", params={"order": "latest", "n": 3})
         logs = resp.json()["logs"]
         assert len(logs) == 3
@@ -447,8 +499,7 @@ class TestLogs:
 
     def test_log_order_earliest(self, admin_client):
         _register_student(admin_client)
-        for i in range(5):
-            _call_func(admin_client, args=[i])
+        _call_many(admin_client, 5)
         resp = admin_client.get("/exp/default/logs", params={"order": "earliest", "n": 3})
         logs = resp.json()["logs"]
         assert len(logs) == 3
@@ -456,15 +507,13 @@ class TestLogs:
 
     def test_log_limit_n(self, admin_client):
         _register_student(admin_client)
-        for i in range(10):
-            _call_func(admin_client, args=[i])
+        _call_many(admin_client, 10)
         resp = admin_client.get("/exp/default/logs", params={"n": 3})
         assert len(resp.json()["logs"]) == 3
 
     def test_log_cursor_pagination(self, admin_client):
         _register_student(admin_client)
-        for i in range(5):
-            _call_func(admin_client, args=[i])
+        _call_many(admin_client, 5)
 
         page1 = admin_client.get("/exp/default/logs", params={"n": 2, "order": "latest"}).json()["logs"]
         assert len(page1) == 2
@@ -490,6 +539,46 @@ class TestLogs:
         assert len(logs) == 1
         assert logs[0]["args"] == [1]
 
+    def test_logs_ndjson_stream(self, admin_client):
+        _register_student(admin_client)
+        _call_many(admin_client, 3)
+        resp = admin_client.get(
+            "/exp/default/logs",
+            params={"order": "earliest"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        logs = [json.loads(line) for line in resp.text.splitlines()]
+        assert [l["args"] for l in logs] == [[0], [1], [2]]
+        assert logs[0]["ts"].endswith("Z")
+
+    def test_logs_ndjson_opens_one_session(self, admin_client, monkeypatch):
+        from leap.core.experiment import ExperimentInfo
+        _register_student(admin_client)
+        _call_many(admin_client, 2)
+        opened = []
+        real = ExperimentInfo.session_factory
+
+        def counting(self):
+            factory = real.fget(self)
+            return lambda: opened.append(1) or factory()
+
+        monkeypatch.setattr(ExperimentInfo, "session_factory", property(counting))
+        resp = admin_client.get(
+            "/exp/default/logs", headers={"Accept": "application/x-ndjson"}
+        )
+        assert len(resp.text.splitlines()) == 2
+        assert len(opened) == 1
+
+    def test_logs_ndjson_unknown_func_still_400(self, admin_client):
+        resp = admin_client.get(
+            "/exp/default/logs",
+            params={"func_name": "nonexistent"},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert resp.status_code == 400
+
     def test_log_options(self, admin_client):
         _register_student(admin_client)
         resp = admin_client.get("/exp/default/log-options")
@@ -613,12 +702,12 @@ class TestDecoratorsViaAPI:
     def test_adminonly_blocked_for_registered_student(self, admin_client):
         """@adminonly function returns 403 even for registered students without admin session."""
         _register_student(admin_client)
-        # Create a non-admin client by using a fresh TestClient
+        # Create a non-admin client by using a fresh TestClient (no lifespan:
+        # the app is shared by the module and already started)
         from fastapi.testclient import TestClient
-        app = admin_client.app
-        with TestClient(app) as non_admin:
-            resp = _call_func(non_admin, func="wipe_data", sid="s001")
-            assert resp.status_code == 403
+        non_admin = TestClient(admin_client.app)
+        resp = _call_func(non_admin, func="wipe_data", sid="s001")
+        assert resp.status_code == 403
 
     def test_adminonly_allowed_for_admin(self, admin_client):
         """@adminonly function executes successfully for admin sessions."""
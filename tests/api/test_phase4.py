@@ -10,15 +10,15 @@ import pytest
 from fastapi.testclient import TestClient
 
 from leap.main import create_app
-from leap.core import storage
 
 
-@pytest.fixture
-def client(tmp_credentials: Path):
-    app = create_app(root=tmp_credentials)
+@pytest.fixture(scope="class")
+def cors_client(module_credentials: Path):
+    """One CORS-enabled app for the whole class; CORS_ORIGINS is read at create_app()."""
+    with patch.dict(os.environ, {"CORS_ORIGINS": "http://localhost:3000, http://a.com, http://b.com"}):
+        app = create_app(root=module_credentials)
     with TestClient(app) as c:
         yield c
-    storage.close_all_engines()
 
 
 class TestSharedPages:
@@ -96,47 +96,31 @@ class TestCORSDisabledByDefault:
 
 
 class TestCORSEnabled:
-    def test_cors_headers_when_configured(self, tmp_credentials):
-        with patch.dict(os.environ, {"CORS_ORIGINS": "http://localhost:3000"}):
-            app = create_app(root=tmp_credentials)
-            with TestClient(app) as c:
-                resp = c.get(
-                    "/api/health",
-                    headers={"Origin": "http://localhost:3000"},
-                )
-                assert resp.headers.get("access-control-allow-origin") == "http://localhost:3000"
-            storage.close_all_engines()
-
-    def test_cors_preflight(self, tmp_credentials):
-        with patch.dict(os.environ, {"CORS_ORIGINS": "http://localhost:3000"}):
-            app = create_app(root=tmp_credentials)
-            with TestClient(app) as c:
-                resp = c.options(
-                    "/api/health",
-                    headers={
-                        "Origin": "http://localhost:3000",
-                        "Access-Control-Request-Method": "GET",
-                    },
-                )
-                assert resp.status_code == 200
-                assert "access-control-allow-origin" in resp.headers
-            storage.close_all_engines()
-
-    def test_cors_rejects_unlisted_origin(self, tmp_credentials):
-        with patch.dict(os.environ, {"CORS_ORIGINS": "http://localhost:3000"}):
-            app = create_app(root=tmp_credentials)
-            with TestClient(app) as c:
-                resp = c.get(
-                    "/api/health",
-                    headers={"Origin": "http://evil.com"},
-                )
-                assert resp.headers.get("access-control-allow-origin") != "http://evil.com"
-            storage.close_all_engines()
-
-    def test_cors_multiple_origins(self, tmp_credentials):
-        with patch.dict(os.environ, {"CORS_ORIGINS": "http://a.com, http://b.com"}):
-            app = create_app(root=tmp_credentials)
-            with TestClient(app) as c:
-                resp = c.get("/api/health", headers={"Origin": "http://b.com"})
-                assert resp.headers.get("access-control-allow-origin") == "http://b.com"
-            storage.close_all_engines()
+    def test_cors_headers_when_configured(self, cors_client):
+        resp = cors_client.get(
+            "/api/health",
+            headers={"Origin": "http://localhost:3000"},
+        )
+        assert resp.headers.get("access-control-allow-origin") == "http://localhost:3000"
+
+    def test_cors_preflight(self, cors_client):
+        resp = cors_client.options(
+            "/api/health",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+        assert resp.status_code == 200
+        assert "access-control-allow-origin" in resp.headers
+
+    def test_cors_rejects_unlisted_origin(self, cors_client):
+        resp = cors_client.get(
+            "/api/health",
+            headers={"Origin": "http://evil.com"},
+        )
+        assert resp.headers.get("access-control-allow-origin") != "http://evil.com"
+
+    def test_cors_multiple_origins(self, cors_client):
+        resp = cors_client.get("/api/health", headers={"Origin": "http://b.com"})
+        assert resp.headers.get("access-control-allow-origin") == "http://b.com"
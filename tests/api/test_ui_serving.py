@@ -3,31 +3,15 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
+import shutil
 from unittest.mock import patch
 
-import pytest
 from fastapi.testclient import TestClient
 
 from leap.main import create_app
 from leap.core import storage
 
 
-@pytest.fixture
-def client(tmp_credentials: Path):
-    app = create_app(root=tmp_credentials)
-    with TestClient(app) as c:
-        yield c
-    storage.close_all_engines()
-
-
-@pytest.fixture
-def admin_client(client: TestClient):
-    resp = client.post("/login", json={"password": "testpass"})
-    assert resp.status_code == 200
-    return client
-
-
 class TestLandingPage:
     def test_landing_returns_html(self, client):
         resp = client.get("/", follow_redirects=False)
@@ -98,6 +82,28 @@ class TestSharedAssets:
         assert resp.status_code == 200
         assert "javascript" in resp.headers["content-type"]
 
+    def test_revalidation_headers(self, client):
+        resp = client.get("/static/theme.css")
+        assert resp.headers["cache-control"] == "no-cache"
+        etag = resp.headers["etag"]
+        resp = client.get("/static/theme.css", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["cache-control"] == "no-cache"
+
+    def test_precompressed_variant(self, client):
+        plain = client.get("/static/theme.css", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        resp = client.get("/static/theme.css", headers={"Accept-Encoding": "br, gzip;q=0.8"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert "text/css" in resp.headers["content-type"]
+        assert int(resp.headers["content-length"]) < len(plain.content)
+        assert resp.content == plain.content
+        assert resp.headers["etag"] != plain.headers["etag"]
+        resp = client.get("/static/theme.css", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in resp.headers
+
     def test_nonexistent_shared_file(self, client):
         resp = client.get("/static/nonexistent.js")
         assert resp.status_code == 404
@@ -121,6 +127,77 @@ class TestExperimentUI:
         resp = client.get("/exp/default/ui/nonexistent.html")
         assert resp.status_code == 404
 
+    def test_rediscover_serves_and_drops_ui(self, admin_client, module_credentials):
+        exp_dir = module_credentials / "experiments" / "extra"
+        (exp_dir / "ui").mkdir(parents=True)
+        (exp_dir / "README.md").write_text("---\nname: extra\n---\n")
+        (exp_dir / "ui" / "index.html").write_text("<h1>Extra</h1>")
+        assert admin_client.get("/exp/extra/ui/index.html").status_code == 404
+        assert admin_client.post("/api/admin/rediscover").json()["added"] == ["extra"]
+        assert admin_client.get("/exp/extra/ui/index.html").text == "<h1>Extra</h1>"
+        shutil.rmtree(exp_dir)
+        assert admin_client.post("/api/admin/rediscover").json()["removed"] == ["extra"]
+        assert admin_client.get("/exp/extra/ui/index.html").status_code == 404
+
+    def test_large_file_served_whole(self, tmp_credentials):
+        from leap.api.staticfiles import CHUNK_SIZE
+        body = bytes(range(256)) * (CHUNK_SIZE // 64)  # 4 chunks
+        (tmp_credentials / "experiments" / "default" / "ui" / "bundle.js").write_bytes(body)
+        app = create_app(root=tmp_credentials)
+        with TestClient(app) as c:
+            resp = c.get("/exp/default/ui/bundle.js")
+            assert resp.status_code == 200
+            assert resp.content == body
+            resp = c.get("/exp/default/ui/bundle.js", headers={"Range": f"bytes={CHUNK_SIZE - 1}-{CHUNK_SIZE}"})
+            assert resp.status_code == 206
+            assert resp.content == body[CHUNK_SIZE - 1:CHUNK_SIZE + 1]
+        storage.close_all_engines()
+
+    def test_precompress_writes_only_to_cache_dir(self, tmp_path):
+        from leap.api.staticfiles import precompress
+        src, cache = tmp_path / "src", tmp_path / "cache"
+        (src / "js").mkdir(parents=True)
+        (src / "js" / "app.js").write_text("console.log('hi');\n" * 200)
+        (src / "tiny.css").write_text("a{}")
+        (src / "logo.png").write_bytes(b"\x89PNG" * 200)
+        assert precompress(src, cache) == [cache / "js" / "app.js.gz"]
+        assert sorted(p.name for p in src.rglob("*")) == ["app.js", "js", "logo.png", "tiny.css"]
+
+    def test_precompress_skips_fresh_twins(self, tmp_path):
+        from leap.api.staticfiles import precompress
+        src, cache = tmp_path / "src", tmp_path / "cache"
+        src.mkdir()
+        app_js = src / "app.js"
+        app_js.write_text("console.log('hi');\n" * 200)
+        assert precompress(src, cache) == [cache / "app.js.gz"]
+        assert precompress(src, cache) == []
+        later = (cache / "app.js.gz").stat().st_mtime + 10
+        os.utime(app_js, (later, later))
+        assert precompress(src, cache) == [cache / "app.js.gz"]
+
+    def test_no_gzip_cache_without_compressible_files(self, tmp_credentials, tmp_path, monkeypatch):
+        pkg_ui = tmp_path / "pkg_ui"
+        (pkg_ui / "shared").mkdir(parents=True)
+        (pkg_ui / "shared" / "logo.png").write_bytes(b"\x89PNG")
+        monkeypatch.setattr("leap.main.package_ui_dir", lambda: pkg_ui)
+        made = []
+        monkeypatch.setattr("leap.main.tempfile.mkdtemp", lambda **kw: made.append(kw))
+        with TestClient(create_app(root=tmp_credentials)) as c:
+            assert c.get("/static/logo.png").status_code == 200
+        assert made == []
+        storage.close_all_engines()
+
+    def test_app_leaves_package_dir_untouched(self, client):
+        from leap.config import package_ui_dir
+        client.get("/static/theme.css")
+        assert list(package_ui_dir().rglob("*.gz")) == []
+
+    def test_api_404_is_json(self, client):
+        resp = client.get("/api/nonexistent")
+        assert resp.status_code == 404
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"detail": "Not Found"}
+
 
 class TestStaticMountCoexistence:
     """Ensure static mounts don't interfere with API routes."""
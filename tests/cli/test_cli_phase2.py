@@ -11,12 +11,20 @@ import typer
 from typer.testing import CliRunner
 
 from leap.cli import app, init_project_fn, init_fn, new_experiment_fn, list_experiments_fn
-from leap.cli import validate_experiment_fn, show_config_fn, doctor_fn, remove_experiment_fn
+from leap.cli import validate_experiment_fn, show_config_fn, doctor_fn, remove_experiment_fn, add_student_fn
 from leap.core.experiment import get_experiment_list, add_experiment_entry, remove_experiment_entry
 
 runner = CliRunner()
 
 
+@pytest.fixture(scope="class")
+def multi_exp_root(tmp_path_factory, make_root):
+    """Read-only root with 'default' plus 'another-one', built once per class."""
+    root = make_root(tmp_path_factory.mktemp("multi"))
+    new_experiment_fn(interactive=False, name="another-one", root=root)
+    return root
+
+
 # ── Shared function tests ──
 
 
@@ -87,14 +95,14 @@ class TestNewExperimentFn:
 
 
 class TestListExperimentsFn:
-    def test_lists_default(self, tmp_root):
-        exps = list_experiments_fn(root=tmp_root)
+    def test_lists_default(self, multi_exp_root):
+        exps = list_experiments_fn(root=multi_exp_root)
         assert len(exps) >= 1
         names = [e["name"] for e in exps]
         assert "default" in names
 
-    def test_experiment_metadata_shape(self, tmp_root):
-        exps = list_experiments_fn(root=tmp_root)
+    def test_experiment_metadata_shape(self, multi_exp_root):
+        exps = list_experiments_fn(root=multi_exp_root)
         exp = exps[0]
         assert "name" in exp
         assert "display_name" in exp
@@ -296,7 +304,7 @@ class TestNewCommand:
         assert result.exit_code == 1
 
     def test_new_duplicate(self, tmp_root):
-        runner.invoke(app, ["add", "dup-exp", "--root", str(tmp_root), "--no-prompt"])
+        new_experiment_fn(interactive=False, name="dup-exp", root=tmp_root)
         result = runner.invoke(app, ["add", "dup-exp", "--root", str(tmp_root), "--no-prompt"])
         assert result.exit_code == 1
 
@@ -306,8 +314,8 @@ class TestNewCommand:
 
 
 class TestListCommand:
-    def test_list_experiments(self, tmp_root):
-        result = runner.invoke(app, ["list", "--root", str(tmp_root)])
+    def test_list_experiments(self, multi_exp_root):
+        result = runner.invoke(app, ["list", "--root", str(multi_exp_root)])
         assert result.exit_code == 0
         assert "default" in result.output
 
@@ -317,9 +325,8 @@ class TestListCommand:
         assert result.exit_code == 0
         assert "No experiments" in result.output
 
-    def test_list_shows_multiple(self, tmp_root):
-        new_experiment_fn(interactive=False, name="another-one", root=tmp_root)
-        result = runner.invoke(app, ["list", "--root", str(tmp_root)])
+    def test_list_shows_multiple(self, multi_exp_root):
+        result = runner.invoke(app, ["list", "--root", str(multi_exp_root)])
         assert "default" in result.output
         assert "another-one" in result.output
 
@@ -385,7 +392,7 @@ class TestImportStudentsCommand:
 
     def test_import_skips_duplicates(self, tmp_root):
         # Pre-add one student
-        runner.invoke(app, ["add-student", "default", "s001", "--root", str(tmp_root)])
+        add_student_fn("default", "s001", root=tmp_root)
         csv_path = self._write_csv(
             tmp_root, "students.csv",
             "student_id,name\ns001,Alice\ns002,Bob\n",
@@ -112,8 +112,21 @@ class TestInstallExperimentFn:
         cmd = call_args[0][0]
         assert cmd[0] == "git"
         assert cmd[1] == "clone"
+        assert cmd[2:5] == ["--depth", "1", "--single-branch"]
+        assert cmd[-2] == "https://github.com/user/test-lab.git"
+        assert "test-lab" in cmd[-1]
+
+    def test_depth_zero_clones_full_history(self, tmp_root):
+        with patch("leap.cli.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            install_experiment_fn(
+                "https://github.com/user/test-lab.git",
+                root=tmp_root,
+                depth=0,
+            )
+        cmd = mock_run.call_args[0][0]
+        assert "--depth" not in cmd
         assert cmd[2] == "https://github.com/user/test-lab.git"
-        assert "test-lab" in cmd[3]
 
     def test_lowercases_name(self, tmp_root):
         with patch("leap.cli.subprocess.run") as mock_run:
@@ -138,7 +151,7 @@ class TestInstallExperimentFn:
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
                 if cmd[0] == "git":
-                    dest = Path(cmd[3])
+                    dest = Path(cmd[-1])
                     dest.mkdir(parents=True, exist_ok=True)
                     (dest / "requirements.txt").write_text("numpy>=1.20\nscipy\n")
                 return MagicMock(returncode=0)
@@ -159,7 +172,7 @@ class TestInstallExperimentFn:
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
                 if cmd[0] == "git":
-                    dest = Path(cmd[3])
+                    dest = Path(cmd[-1])
                     dest.mkdir(parents=True, exist_ok=True)
                 return MagicMock(returncode=0)
 
@@ -177,7 +190,7 @@ class TestInstallExperimentFn:
             nonlocal call_count
             call_count += 1
             if cmd[0] == "git":
-                dest = Path(cmd[3])
+                dest = Path(cmd[-1])
                 dest.mkdir(parents=True, exist_ok=True)
                 (dest / "requirements.txt").write_text("nonexistent-pkg-xyz\n")
                 return MagicMock(returncode=0)
@@ -202,7 +215,7 @@ class TestInstallCommand:
             # Need to handle that install_fn creates nothing (mocked git)
             # but validate_experiment_fn will run — create minimal structure
             def side_effect(cmd, **kwargs):
-                dest = Path(cmd[3])
+                dest = Path(cmd[-1])
                 dest.mkdir(parents=True, exist_ok=True)
                 (dest / "README.md").write_text("---\nname: test-repo\n---\n")
                 (dest / "funcs").mkdir()
@@ -220,7 +233,7 @@ class TestInstallCommand:
     def test_install_with_name_override(self, tmp_root):
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
-                dest = Path(cmd[3])
+                dest = Path(cmd[-1])
                 dest.mkdir(parents=True, exist_ok=True)
                 (dest / "README.md").write_text("---\nname: custom\n---\n")
                 (dest / "funcs").mkdir()
@@ -247,7 +260,7 @@ class TestInstallCommand:
     def test_install_shows_validation(self, tmp_root):
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
-                dest = Path(cmd[3])
+                dest = Path(cmd[-1])
                 dest.mkdir(parents=True, exist_ok=True)
                 (dest / "README.md").write_text("---\nname: validated\n---\n")
                 (dest / "funcs").mkdir()
@@ -337,7 +350,7 @@ class TestInstallRejectsLab:
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
                 if cmd[0] == "git" and cmd[1] == "clone":
-                    dest = Path(cmd[3])
+                    dest = Path(cmd[-1])
                     dest.mkdir(parents=True, exist_ok=True)
                     (dest / "README.md").write_text(
                         "---\nname: other-lab\ntype: lab\nexperiments: []\n---\n"
@@ -361,7 +374,7 @@ class TestInstallRejectsLab:
         with patch("leap.cli.subprocess.run") as mock_run:
             def side_effect(cmd, **kwargs):
                 if cmd[0] == "git" and cmd[1] == "clone":
-                    dest = Path(cmd[3])
+                    dest = Path(cmd[-1])
                     dest.mkdir(parents=True, exist_ok=True)
                     (dest / "README.md").write_text(
                         "---\nname: cool-exp\ntype: experiment\n---\n"
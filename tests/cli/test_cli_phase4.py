@@ -107,6 +107,18 @@ class TestExportLogsFn:
         lines = out_file.read_text().strip().split("\n")
         assert len(lines) == 20
 
+    def test_export_small_batches(self, tmp_root):
+        """Rows are written batch by batch without gaps or duplicates."""
+        _seed_logs(tmp_root, 7)
+        out_file = tmp_root / "paged.csv"
+        count = export_logs_fn("default", "csv", out_file, root=tmp_root, batch_size=3)
+        storage.close_all_engines()
+        assert count == 7
+        rows = list(csv.DictReader(open(out_file)))
+        ids = [int(r["id"]) for r in rows]
+        assert ids == sorted(set(ids))
+        assert len(ids) == 7
+
     def test_export_csv_args_are_json(self, tmp_root):
         _seed_logs(tmp_root, 1)
         out_file = tmp_root / "args.csv"
@@ -117,6 +129,22 @@ class TestExportLogsFn:
         parsed = json.loads(row["args"])
         assert isinstance(parsed, list)
 
+    def test_export_wide_ints_exact(self, tmp_root):
+        _seed_logs(tmp_root, 0)
+        exp_info = ExperimentInfo("default", tmp_root / "experiments" / "default")
+        with storage.get_session("default", exp_info.db_path) as session:
+            storage.add_log(
+                session, student_id="s001", experiment="default",
+                func_name="square", args=[2**35 + 1], result=(2**35 + 1) ** 2,
+            )
+        jsonl, csv_file = tmp_root / "wide.jsonl", tmp_root / "wide.csv"
+        export_logs_fn("default", "jsonlines", jsonl, root=tmp_root)
+        export_logs_fn("default", "csv", csv_file, root=tmp_root)
+        storage.close_all_engines()
+        assert json.loads(jsonl.read_text())["result"] == (2**35 + 1) ** 2
+        row = next(csv.DictReader(open(csv_file)))
+        assert json.loads(row["result"]) == (2**35 + 1) ** 2
+
 
 class TestExportCommand:
     def test_export_to_file(self, tmp_root):
@@ -65,7 +65,7 @@ def _mock_response(text, status_code=200):
 
 
 class TestDiscoverRegistryFn:
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_fetches_and_parses_registry(self, mock_get):
         mock_get.return_value = _mock_response(SAMPLE_YAML)
         labs = discover_registry_fn()
@@ -73,27 +73,27 @@ class TestDiscoverRegistryFn:
         assert labs[0]["name"] == "gradient-descent"
         assert labs[1]["name"] == "graph-search"
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_filter_by_tag(self, mock_get):
         mock_get.return_value = _mock_response(SAMPLE_YAML)
         labs = discover_registry_fn(tag="algorithms")
         assert len(labs) == 1
         assert labs[0]["name"] == "graph-search"
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_filter_case_insensitive(self, mock_get):
         mock_get.return_value = _mock_response(SAMPLE_YAML)
         labs = discover_registry_fn(tag="ML")
         assert len(labs) == 1
         assert labs[0]["name"] == "gradient-descent"
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_empty_registry(self, mock_get):
         mock_get.return_value = _mock_response("")
         labs = discover_registry_fn()
         assert labs == []
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_network_error(self, mock_get):
         mock_get.side_effect = Exception("Connection refused")
         with pytest.raises(typer.BadParameter, match="Failed to fetch registry"):
@@ -101,7 +101,7 @@ class TestDiscoverRegistryFn:
 
 
 class TestDiscoverCommand:
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_prints_table(self, mock_get):
         mock_get.return_value = _mock_response(SAMPLE_YAML)
         result = runner.invoke(app, ["discover"])
@@ -110,7 +110,7 @@ class TestDiscoverCommand:
         assert "graph-search" in result.output
         assert "Install a lab with:" in result.output
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_with_tag_filter(self, mock_get):
         mock_get.return_value = _mock_response(SAMPLE_YAML)
         result = runner.invoke(app, ["discover", "--tag", "algorithms"])
@@ -118,7 +118,7 @@ class TestDiscoverCommand:
         assert "graph-search" in result.output
         assert "gradient-descent" not in result.output
 
-    @patch("leap.cli.requests.get")
+    @patch("requests.get")
     def test_empty(self, mock_get):
         mock_get.return_value = _mock_response("")
         result = runner.invoke(app, ["discover"])
@@ -48,6 +48,8 @@ def _make_client(test_client: TestClient, experiment: str = "default") -> LogCli
     client.server_url = "http://testserver"
     client.experiment = experiment
     client._api_base = f"http://testserver/exp/{experiment}"
+    client._logs_url = f"{client._api_base}/logs"
+    client._log_options_url = f"{client._api_base}/log-options"
 
     original_get = client._get
 
@@ -79,6 +81,34 @@ class TestLogClientInit:
         assert c.server_url == "http://localhost:9000"
         assert c._api_base == "http://localhost:9000/exp/default"
 
+    def test_reuses_pooled_session(self):
+        c = LogClient("http://localhost:9000", experiment="default")
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"logs": []}
+        with patch.object(c._session, "get", return_value=resp) as mock_get:
+            c.get_logs()
+            c.get_logs(n=5)
+        assert mock_get.call_count == 2
+        c.close()
+
+    def test_always_sends_n_and_order(self):
+        c = LogClient("http://localhost:9000", experiment="default")
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"logs": []}
+        with patch.object(c._session, "get", return_value=resp) as mock_get:
+            c.get_all_logs()
+        params = mock_get.call_args.kwargs["params"]
+        assert params["n"] == 10_000
+        assert params["order"] == "latest"
+        c.close()
+
+    def test_context_manager_closes_session(self):
+        c = LogClient("http://localhost:9000", experiment="default")
+        with patch.object(c._session, "close") as mock_close:
+            with c:
+                pass
+        mock_close.assert_called_once()
+
     def test_api_base_construction(self):
         c = LogClient("http://example.com", experiment="my-lab")
         assert c._api_base == "http://example.com/exp/my-lab"
@@ -194,6 +224,20 @@ class TestGetAllLogs:
         assert len(all_logs) == 5
         assert all(l["student_id"] == "s001" for l in all_logs)
 
+    def test_get_all_logs_exact_page_multiple(self, seeded_server):
+        client = _make_client(seeded_server)
+        all_logs = client.get_all_logs(page_size=4, order="earliest")
+        ids = [l["id"] for l in all_logs]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 8
+
+    def test_iter_all_logs_is_lazy(self, seeded_server):
+        client = _make_client(seeded_server)
+        it = client.iter_all_logs(page_size=3)
+        first = next(it)
+        assert "id" in first
+        assert len([first, *it]) == 8
+
     def test_get_all_logs_empty(self, server):
         client = _make_client(server)
         all_logs = client.get_all_logs()
@@ -5,12 +5,17 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import asyncio
+import sys
+
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from leap.main import create_app
 from leap.core import storage
 from leap.client.rpc import (
+    AsyncRPCClient,
     RPCClient,
     RPCError,
     RPCServerError,
@@ -68,11 +73,19 @@ def _make_client(
             self.status_code = tc_resp.status_code
             self.ok = 200 <= tc_resp.status_code < 400
             self.text = tc_resp.text
+            self.content = tc_resp.content
+            self.headers = tc_resp.headers
             self.reason = ""
 
         def json(self):
             return self._r.json()
 
+        def iter_lines(self):
+            return iter(self.content.splitlines())
+
+        def close(self):
+            pass
+
         def raise_for_status(self):
             if not self.ok:
                 raise Exception(f"HTTP {self.status_code}")
@@ -80,17 +93,26 @@ def _make_client(
     def fake_get(url, **kwargs):
         path = url.replace("http://testserver", "")
         params = kwargs.get("params")
-        return FakeResponse(real_get(path, params=params))
+        return FakeResponse(real_get(path, params=params, headers=kwargs.get("headers")))
 
     def fake_post(url, **kwargs):
         path = url.replace("http://testserver", "")
         json_data = kwargs.get("json")
         return FakeResponse(real_post(path, json=json_data))
 
-    with patch("leap.client.rpc.requests") as mock_requests:
-        mock_requests.get = fake_get
-        mock_requests.post = fake_post
-        mock_requests.exceptions = __import__("requests").exceptions
+    class FakeSession:
+        """Stands in for the client's pooled requests.Session."""
+
+        get = staticmethod(fake_get)
+        post = staticmethod(fake_post)
+
+        def mount(self, prefix, adapter):
+            pass
+
+        def close(self):
+            pass
+
+    with patch("leap.client.rpc.requests.Session", FakeSession):
         client = RPCClient(
             server_url="http://testserver",
             student_id=student_id,
@@ -98,44 +120,6 @@ def _make_client(
             trial_name=trial_name,
         )
 
-    client._patch_requests = mock_requests
-    client._fake_get = fake_get
-    client._fake_post = fake_post
-
-    # Patch requests globally for subsequent calls on this client
-    _orig_call = client.call
-
-    def patched_call(func_name, *args, **kwargs):
-        with patch("leap.client.rpc.requests") as mr:
-            mr.get = fake_get
-            mr.post = fake_post
-            mr.exceptions = __import__("requests").exceptions
-            return _orig_call(func_name, *args, **kwargs)
-
-    client.call = patched_call
-
-    _orig_is_reg = client.is_registered
-
-    def patched_is_registered():
-        with patch("leap.client.rpc.requests") as mr:
-            mr.get = fake_get
-            mr.post = fake_post
-            mr.exceptions = __import__("requests").exceptions
-            return _orig_is_reg()
-
-    client.is_registered = patched_is_registered
-
-    _orig_fetch_logs = client.fetch_logs
-
-    def patched_fetch_logs(**kwargs):
-        with patch("leap.client.rpc.requests") as mr:
-            mr.get = fake_get
-            mr.post = fake_post
-            mr.exceptions = __import__("requests").exceptions
-            return _orig_fetch_logs(**kwargs)
-
-    client.fetch_logs = patched_fetch_logs
-
     return client
 
 
@@ -163,16 +147,25 @@ class TestInit:
         assert client.trial_name == "trial-1"
 
     def test_strips_trailing_slash(self, server):
-        with patch("leap.client.rpc.requests") as mr:
-            mr.get = lambda url, **kw: MagicMock(
+        with patch("leap.client.rpc.requests.Session") as mock_session:
+            mock_session.return_value.get = lambda url, **kw: MagicMock(
                 status_code=200, ok=True,
-                json=lambda: {"square": {"signature": "(x)", "doc": ""}},
+                content=b'{"square": {"signature": "(x)", "doc": ""}}',
                 raise_for_status=lambda: None,
             )
-            mr.exceptions = __import__("requests").exceptions
             client = RPCClient("http://localhost:9000/", student_id="s001", experiment="default")
         assert client.server_url == "http://localhost:9000"
 
+    def test_single_session_closed_by_context_manager(self):
+        with patch("leap.client.rpc.requests.Session") as mock_session:
+            mock_session.return_value.get.return_value = MagicMock(
+                content=b"{}", raise_for_status=lambda: None,
+            )
+            with RPCClient("http://localhost:9000", student_id="s001", experiment="default"):
+                pass
+        mock_session.assert_called_once()
+        mock_session.return_value.close.assert_called_once()
+
 
 # ── Function calls ──
 
@@ -193,6 +186,16 @@ class TestCall:
         result = client.call("cubic", 3)
         assert result == 27
 
+    def test_call_wide_int_exact(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        assert client.call("square", 2**35 + 1) == (2**35 + 1) ** 2
+
+    def test_call_ints_just_outside_64_bits_exact(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        assert client.call("echo", -2**63 - 1) == -2**63 - 1
+        assert client.call("echo", 2**64) == 2**64
+        assert client.call("echo", [-2**63 - 1, 2**64]) == [-2**63 - 1, 2**64]
+
     def test_unregistered_student_raises(self, server):
         client = _make_client(server, student_id="unregistered")
         with pytest.raises(RPCNotRegisteredError, match="not registered"):
@@ -204,6 +207,74 @@ class TestCall:
             client.call("nonexistent_func", 1)
 
 
+class TestCallMany:
+    def test_results_in_order(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        results = client.call_many([("square", (2,)), ("add", (3, 4)), ("ping",)])
+        assert results == [4, 7, "pong"]
+
+    def test_failure_raises(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        with pytest.raises(RPCServerError, match="nonexistent_func"):
+            client.call_many([("square", (2,)), ("nonexistent_func", (1,))])
+
+    def test_return_exceptions(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        results = client.call_many([("nonexistent_func", (1,)), ("square", (3,))], return_exceptions=True)
+        assert isinstance(results[0], RPCServerError)
+        assert results[1] == 9
+
+    def test_unregistered(self, server):
+        client = _make_client(server, student_id="unregistered")
+        with pytest.raises(RPCNotRegisteredError):
+            client.call_many([("square", (5,))])
+
+
+def _make_async_client(test_client: TestClient, student_id: str = "s001") -> AsyncRPCClient:
+    """Create an AsyncRPCClient that talks to the app in-process over ASGI."""
+    client = AsyncRPCClient("http://testserver", student_id=student_id, experiment="default")
+    client._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=test_client.app))
+    return client
+
+
+class TestAsyncRPCClient:
+    def test_concurrent_calls(self, seeded_server):
+        async def run():
+            async with _make_async_client(seeded_server) as client:
+                return await asyncio.gather(*(client.call("square", x) for x in range(10)))
+        assert asyncio.run(run()) == [x * x for x in range(10)]
+
+    def test_call_many(self, seeded_server):
+        async def run():
+            async with _make_async_client(seeded_server) as client:
+                return await client.call_many([("square", (4,)), ("add", (1, 1))])
+        assert asyncio.run(run()) == [16, 2]
+
+    def test_unregistered_raises(self, server):
+        async def run():
+            async with _make_async_client(server, student_id="nobody") as client:
+                await client.call("square", 1)
+        with pytest.raises(RPCNotRegisteredError):
+            asyncio.run(run())
+
+    def test_list_functions_and_logs(self, seeded_server):
+        async def run():
+            async with _make_async_client(seeded_server) as client:
+                funcs = await client.list_functions()
+                registered = await client.is_registered()
+                logs = await client.fetch_logs(student_id="s001")
+                return funcs, registered, logs
+        funcs, registered, logs = asyncio.run(run())
+        assert "square" in funcs
+        assert registered is True
+        assert len(logs) == 5
+
+    def test_http2_without_h2_hints_extra(self):
+        with patch.dict(sys.modules, {"h2": None}):
+            with pytest.raises(ImportError, match=r"leaplive\[http2\]"):
+                AsyncRPCClient("http://testserver", student_id="s001", experiment="default", http2=True)
+
+
 # ── Dynamic dispatch ──
 
 
@@ -218,6 +289,30 @@ class TestDynamicDispatch:
         assert hasattr(client, "square")
         assert callable(client.square)
 
+    def test_methods_bound_at_discovery(self, server):
+        client = _make_client(server)
+        assert "square" in vars(client)
+        assert client.square.__doc__.startswith("square(")
+
+    def test_remote_name_does_not_shadow_client_method(self, server):
+        client = _make_client(server)
+        client._bind("help", {"signature": "()"})
+        assert client.help.__func__ is RPCClient.help
+
+    def test_remote_name_does_not_overwrite_client_state(self, tmp_credentials):
+        (tmp_credentials / "experiments" / "default" / "funcs" / "clash.py").write_text(
+            "from leap import noregcheck\n\n"
+            "@noregcheck\ndef experiment():\n    return 'remote'\n\n"
+            "@noregcheck\ndef student_id():\n    return 'remote'\n"
+        )
+        app = create_app(root=tmp_credentials)
+        with TestClient(app) as c:
+            client = _make_client(c, student_id="s001")
+            assert client.experiment == "default"
+            assert client.student_id == "s001"
+            assert client.call("experiment") == "remote"
+        storage.close_all_engines()
+
     def test_unknown_attr_raises(self, server):
         client = _make_client(server)
         with pytest.raises(AttributeError, match="No function 'nonexistent'"):
@@ -302,6 +397,30 @@ class TestIsRegistered:
         client = _make_client(seeded_server, student_id="s002")
         assert client.is_registered() is True
 
+    def test_recheck_revalidates_with_etag(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        assert client.is_registered() is True
+        etag = client._registration[0]
+        assert etag.startswith('W/"reg-')
+        seen = []
+        real_get = client._session.get
+
+        def spy_get(url, **kwargs):
+            resp = real_get(url, **kwargs)
+            seen.append((kwargs.get("headers"), resp.status_code))
+            return resp
+
+        client._session.get = spy_get
+        assert client.is_registered() is True
+        assert seen == [({"If-None-Match": etag}, 304)]
+
+    def test_endpoint_unavailable_raises_without_probe(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        client._is_registered_url = client._base + "/missing"
+        with pytest.raises(RPCError, match="probe=True"):
+            client.is_registered()
+        assert client.is_registered(probe=True) is True
+
 
 # ── fetch_logs ──
 
@@ -352,6 +471,23 @@ class TestFetchLogs:
         logs = client.fetch_logs()
         assert logs == []
 
+    def test_iter_logs_matches_fetch_logs(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        it = client.iter_logs(func_name="add", order="earliest")
+        assert not isinstance(it, list)
+        assert list(it) == client.fetch_logs(func_name="add", order="earliest")
+
+    def test_wide_int_logs_exact(self, seeded_server):
+        client = _make_client(seeded_server, student_id="s001")
+        client.call("square", 2**35 + 1)
+        expected = (2**35 + 1) ** 2
+        assert client.fetch_logs(n=1)[0]["result"] == expected
+        assert next(client.iter_logs(n=1))["result"] == expected
+
+    def test_iter_logs_empty(self, server):
+        client = _make_client(server)
+        assert list(client.iter_logs()) == []
+
     def test_log_entry_shape(self, seeded_server):
         client = _make_client(seeded_server, student_id="s001")
         logs = client.fetch_logs(n=1)
@@ -12,9 +12,8 @@ import pytest
 os.environ.setdefault("LEAP_RATE_LIMIT", "0")
 
 
-@pytest.fixture
-def tmp_root(tmp_path: Path) -> Path:
-    """Create a temporary LEAP2 project root with a default experiment."""
+def _populate_root(tmp_path: Path) -> Path:
+    """Lay out a LEAP2 project root with a default experiment under tmp_path."""
     exp_dir = tmp_path / "experiments" / "default"
     funcs_dir = exp_dir / "funcs"
     funcs_dir.mkdir(parents=True)
@@ -105,12 +104,40 @@ def tmp_root(tmp_path: Path) -> Path:
     return tmp_path
 
 
-@pytest.fixture
-def tmp_credentials(tmp_root: Path) -> Path:
-    """Create test admin credentials (password: 'testpass')."""
+def _write_credentials(root: Path, cred: dict) -> None:
+    (root / "config" / "admin_credentials.json").write_text(json.dumps(cred))
+
+
+@pytest.fixture(scope="session")
+def test_cred() -> dict:
+    """Admin credential for password 'testpass', hashed once per run (PBKDF2 is slow)."""
     from leap.core.auth import hash_password
 
-    cred = hash_password("testpass")
-    cred_path = tmp_root / "config" / "admin_credentials.json"
-    cred_path.write_text(json.dumps(cred))
+    return hash_password("testpass")
+
+
+@pytest.fixture
+def tmp_root(tmp_path: Path) -> Path:
+    """Create a temporary LEAP2 project root with a default experiment."""
+    return _populate_root(tmp_path)
+
+
+@pytest.fixture
+def tmp_credentials(tmp_root: Path, test_cred: dict) -> Path:
+    """Create test admin credentials (password: 'testpass')."""
+    _write_credentials(tmp_root, test_cred)
     return tmp_root
+
+
+@pytest.fixture(scope="session")
+def make_root():
+    """Factory for class/module-scoped fixtures: lay out a project root in a given dir."""
+    return _populate_root
+
+
+@pytest.fixture(scope="module")
+def module_credentials(tmp_path_factory, make_root, test_cred: dict) -> Path:
+    """Like tmp_credentials, but one root shared by every test in a module."""
+    root = make_root(tmp_path_factory.mktemp("root"))
+    _write_credentials(root, test_cred)
+    return root
@@ -65,6 +65,18 @@ class TestPasswordHashing:
         int(cred["password_hash"], 16)  # should not raise
         int(cred["salt"], 16)
 
+    @pytest.mark.parametrize("raw", ["abc", "0", "-5", "1e5"])
+    def test_bad_iterations_env_falls_back(self, monkeypatch, caplog, raw):
+        monkeypatch.setenv("LEAP_PBKDF2_ITERATIONS", raw)
+        assert auth._iterations_from_env() == auth.DEFAULT_ITERATIONS
+        assert "LEAP_PBKDF2_ITERATIONS" in caplog.text
+
+    def test_iterations_env_override(self, monkeypatch):
+        monkeypatch.setenv("LEAP_PBKDF2_ITERATIONS", "1000")
+        assert auth._iterations_from_env() == 1000
+        monkeypatch.delenv("LEAP_PBKDF2_ITERATIONS")
+        assert auth._iterations_from_env() == auth.DEFAULT_ITERATIONS
+
 
 class TestCredentialIO:
     def test_save_and_load(self, tmp_path: Path):
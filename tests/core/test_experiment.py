@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
 import pytest
@@ -29,7 +31,7 @@ class TestNameValidation:
 
     @pytest.mark.parametrize("name", [
         "", "Default", "my lab", "lab.1", "../evil", "-start", "_start",
-        "UPPER", "has space", "a/b", "a\\b", "name!", "a..b",
+        "UPPER", "has space", "a/b", "a\\b", "name!", "a..b", "lab\n",
     ])
     def test_invalid_names(self, name):
         assert validate_experiment_name(name) is False
@@ -77,6 +79,15 @@ class TestFrontmatter:
         assert fm["display_name"] == ""
         assert fm["description"] == ""
 
+    def test_parse_cached_until_modified(self, tmp_path: Path):
+        readme = tmp_path / "README.md"
+        readme.write_text("---\ntags: [a]\n---\n")
+        fm = parse_frontmatter(readme)
+        fm["tags"].append("mutated")
+        assert parse_frontmatter(readme)["tags"] == ["a"]
+        readme.write_text("---\ntags: [a, b]\n---\n")
+        assert parse_frontmatter(readme)["tags"] == ["a", "b"]
+
     def test_parse_no_frontmatter(self, tmp_path: Path):
         readme = tmp_path / "README.md"
         readme.write_text("# Just markdown\nNo frontmatter here.")
@@ -312,6 +323,14 @@ class TestExperimentInfo:
         assert "description" in meta
         assert "entry_point" in meta
 
+    def test_entry_url(self, tmp_root: Path):
+        exp_dir = tmp_root / "experiments" / "default"
+        exp = ExperimentInfo("default", exp_dir)
+        assert exp.entry_url == "/static/readme.html?exp=default"
+        (exp_dir / "README.md").write_text("---\nentry_point: dashboard.html\n---\n")
+        exp = ExperimentInfo("default", exp_dir)
+        assert exp.entry_url == "/exp/default/ui/dashboard.html"
+
     def test_get_functions_info(self, tmp_root: Path):
         exp = ExperimentInfo("default", tmp_root / "experiments" / "default")
         info = exp.get_functions_info()
@@ -319,6 +338,44 @@ class TestExperimentInfo:
         assert "signature" in info["square"]
         assert "doc" in info["square"]
 
+    def test_functions_info_cached_until_reload(self, tmp_root: Path):
+        exp = ExperimentInfo("default", tmp_root / "experiments" / "default")
+        info = exp.get_functions_info()
+        assert exp.get_functions_info() is info
+        (tmp_root / "experiments" / "default" / "funcs" / "extra.py").write_text(
+            "def triple(x): return x * 3\n"
+        )
+        exp.reload_functions()
+        assert "triple" in exp.get_functions_info()
+
+    def test_functions_info_json_cached_until_reload(self, tmp_root: Path):
+        exp = ExperimentInfo("default", tmp_root / "experiments" / "default")
+        body = exp.functions_info_json()
+        assert exp.functions_info_json() is body
+        assert json.loads(body) == exp.get_functions_info()
+        (tmp_root / "experiments" / "default" / "funcs" / "extra.py").write_text(
+            "def triple(x): return x * 3\n"
+        )
+        exp.reload_functions()
+        assert "triple" in json.loads(exp.functions_info_json())
+
+    def test_readme_body_cached_until_modified(self, tmp_root: Path):
+        exp = ExperimentInfo("default", tmp_root / "experiments" / "default")
+        assert exp.readme_body() == "# Test"
+        assert exp.readme_body() is exp.readme_body()
+        exp.readme_path.write_text("---\nname: default\n---\n\n# Edited\n")
+        st = exp.readme_path.stat()
+        os.utime(exp.readme_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert exp.readme_body() == "# Edited"
+
+    def test_readme_body_sees_same_mtime_edit(self, tmp_root: Path):
+        exp = ExperimentInfo("default", tmp_root / "experiments" / "default")
+        st = exp.readme_path.stat()
+        assert exp.readme_body() == "# Test"
+        exp.readme_path.write_text("---\nname: default\n---\n\n# Edited body\n")
+        os.utime(exp.readme_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert exp.readme_body() == "# Edited body"
+
     def test_missing_readme_uses_defaults(self, tmp_path: Path):
         exp_dir = tmp_path / "experiments" / "noreadme"
         (exp_dir / "funcs").mkdir(parents=True)
@@ -74,3 +74,21 @@ class TestImportFiltering:
         assert "alpha" in functions
         assert "beta" in functions
         assert "_private" not in functions  # underscore prefix still skipped
+
+    def test_definition_order_preserved(self, tmp_path: Path):
+        funcs_dir = tmp_path / "funcs"
+        funcs_dir.mkdir()
+        (funcs_dir / "ordered.py").write_text(
+            "def zeta(): return 1\n"
+            "def alpha(): return 2\n"
+        )
+        assert list(load_functions(funcs_dir)) == ["zeta", "alpha"]
+
+    def test_all_with_missing_name_skipped(self, tmp_path: Path):
+        funcs_dir = tmp_path / "funcs"
+        funcs_dir.mkdir()
+        (funcs_dir / "broken_all.py").write_text(
+            "__all__ = ['real', 'missing']\n\n"
+            "def real(): return 1\n"
+        )
+        assert list(load_functions(funcs_dir)) == ["real"]
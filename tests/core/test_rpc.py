@@ -111,7 +111,7 @@ class TestStudentIdValidation:
     @pytest.mark.parametrize("sid", [
         "", "a b",
         pytest.param("x" * 256, id="over-255-chars"),
-        "a/b", "a\\b", "name@email", "hello!", "a\tb", "a\nb",
+        "a/b", "a\\b", "name@email", "hello!", "a\tb", "a\nb", "s001\n",
     ])
     def test_invalid(self, sid):
         assert rpc.validate_student_id(sid) is False
@@ -305,6 +305,52 @@ class TestExecuteRPCOpenExperiment:
         assert len(logs) == 3
 
 
+# ── Batch execution ──
+
+
+class TestExecuteRPCBatch:
+    def test_results_in_order(self, exp_with_session):
+        exp, session = exp_with_session
+        storage.add_student(session, "s001", "Alice")
+        results = rpc.execute_rpc_batch(
+            exp, session,
+            calls=[{"func_name": "square", "args": [i]} for i in range(4)],
+            student_id="s001",
+        )
+        assert results == [{"result": i * i} for i in range(4)]
+        assert len(storage.query_logs(session)) == 4
+
+    def test_failed_call_does_not_stop_batch(self, exp_with_session):
+        exp, session = exp_with_session
+        storage.add_student(session, "s001", "Alice")
+        results = rpc.execute_rpc_batch(
+            exp, session,
+            calls=[
+                {"func_name": "square", "args": [2]},
+                {"func_name": "nope"},
+                {"func_name": "square", "args": [3]},
+            ],
+            student_id="s001",
+        )
+        assert results[0] == {"result": 4}
+        assert results[1]["status"] == 400
+        assert "Unknown function" in results[1]["error"]
+        assert results[2] == {"result": 9}
+
+    def test_unregistered_entries_are_403(self, exp_with_session):
+        exp, session = exp_with_session
+        results = rpc.execute_rpc_batch(
+            exp, session, calls=[{"func_name": "square", "args": [1]}], student_id="nobody"
+        )
+        assert results[0]["status"] == 403
+
+    def test_batch_size_limit(self, exp_with_session):
+        exp, session = exp_with_session
+        calls = [{"func_name": "square", "args": [1]}] * (rpc.MAX_BATCH_SIZE + 1)
+        with pytest.raises(ValueError, match="Batch too large"):
+            rpc.execute_rpc_batch(exp, session, calls=calls, student_id="s001")
+
+
 # ── Rate Limiting ──
 
 
@@ -384,6 +430,14 @@ class TestRateLimiting:
         for i in range(5):
             rpc.execute_rpc(exp, session, func_name="echo", args=[i], student_id="s1")
 
+    def test_concurrent_calls_respect_limit(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        key = ("exp", "fn", "s1")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            allowed = list(pool.map(lambda _: rpc._check_rate_limit(key, "50/minute"), range(200)))
+        assert sum(allowed) == 50
+
     def test_parse_limit_various_periods(self):
         assert rpc._parse_limit("10/second") == (10, 1)
         assert rpc._parse_limit("60/minute") == (60, 60)
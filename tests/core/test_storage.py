@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import math
 import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+import orjson
 import pytest
 
 from leap.core import storage
@@ -100,6 +102,33 @@ class TestStudentCRUD:
     def test_list_students_empty(self, db_session):
         assert storage.list_students(db_session) == []
 
+    def test_is_registered_cached(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        assert storage.is_registered_cached("test", db_path, "s001") is False
+        session = storage.get_session("test", db_path)
+        storage.add_student(session, "s001", "Alice")
+        assert storage.is_registered_cached("test", db_path, "s001") is True
+        assert (str(db_path), "s001") in storage._registered_cache
+        storage.delete_student(session, "s001", db_path)
+        assert (str(db_path), "s001") not in storage._registered_cache
+        assert storage.is_registered_cached("test", db_path, "s001") is False
+        session.close()
+        storage.close_all_engines()
+
+    @pytest.mark.parametrize("pass_db_path", [True, False])
+    def test_delete_invalidates_cache_keyed_by_db_path(self, tmp_path, pass_db_path):
+        # SQLAlchemy unquotes %41 in the engine URL (DuckDB opens labA/), so
+        # the URL's database no longer matches the cache key
+        db_path = tmp_path / "lab%41" / "test.db"
+        (tmp_path / "labA").mkdir()
+        session = storage.get_session("test", db_path)
+        storage.add_student(session, "s001", "Alice")
+        assert storage.is_registered_cached("test", db_path, "s001") is True
+        storage.delete_student(session, "s001", db_path if pass_db_path else None)
+        assert storage.is_registered_cached("test", db_path, "s001") is False
+        session.close()
+        storage.close_all_engines()
+
 
 class TestBulkAddStudents:
     def test_bulk_add_basic(self, db_session):
@@ -146,6 +175,15 @@ class TestBulkAddStudents:
         result = storage.bulk_add_students(db_session, [])
         assert result == {"added": [], "skipped": [], "errors": []}
 
+    def test_bulk_add_repeated_id_in_batch(self, db_session):
+        result = storage.bulk_add_students(db_session, [
+            {"student_id": "s001", "name": "Alice"},
+            {"student_id": "s001", "name": "Alice Again"},
+        ])
+        assert result["added"] == ["s001"]
+        assert result["skipped"] == ["s001"]
+        assert storage.list_students(db_session)[0]["name"] == "Alice"
+
     def test_bulk_add_with_email(self, db_session):
         result = storage.bulk_add_students(db_session, [
             {"student_id": "s001", "name": "Alice", "email": "alice@u.edu"},
@@ -335,6 +373,96 @@ class TestLogCRUD:
         assert logs[0]["experiment"] == "lab-alpha"
 
 
+# ── Group-commit log writer ──
+
+
+class TestSubmitLog:
+    def test_submit_log_visible_after_return(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        storage.submit_log(
+            "test", db_path,
+            student_id="s001", experiment="test", func_name="square", args=[3], result=9,
+        )
+        session = storage.get_session("test", db_path)
+        logs = storage.query_logs(session)
+        assert len(logs) == 1
+        assert logs[0]["args"] == [3]
+        assert logs[0]["result"] == 9
+        session.close()
+        storage.close_all_engines()
+
+    def test_concurrent_submits_all_committed(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        db_path = tmp_path / "db" / "test.db"
+
+        def log_one(i):
+            storage.submit_log(
+                "test", db_path,
+                student_id=f"s{i % 5}", experiment="test", func_name="f", args=[i],
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(log_one, range(100)))
+        session = storage.get_session("test", db_path)
+        assert storage.count_logs(session) == 100
+        session.close()
+        storage.close_all_engines()
+
+    def test_batched_ts_matches_add_log_off_utc(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            db_path = tmp_path / "db" / "test.db"
+            storage.submit_log("test", db_path, student_id="s1", experiment="test", func_name="batched", args=[])
+            session = storage.get_session("test", db_path)
+            storage.add_log(session, student_id="s1", experiment="test", func_name="orm", args=[])
+            ts = {
+                log["func_name"]: datetime.fromisoformat(log["ts"].rstrip("Z"))
+                for log in storage.query_logs(session)
+            }
+            session.close()
+            storage.close_all_engines()
+            assert abs(ts["batched"] - ts["orm"]) < timedelta(minutes=1)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+    def test_close_all_engines_stops_writer(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        storage.submit_log("test", db_path, student_id="s1", experiment="test", func_name="f", args=[])
+        batcher = storage._log_batchers[str(db_path)]
+        storage.close_all_engines()
+        assert not batcher._thread.is_alive()
+        assert storage._log_batchers == {}
+
+    def test_no_wait_submits_visible_after_flush(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        for i in range(50):
+            storage.submit_log(
+                "test", db_path, wait=False,
+                student_id="s1", experiment="test", func_name="f", args=[i],
+            )
+        storage.flush_logs()
+        session = storage.get_session("test", db_path)
+        assert storage.count_logs(session) == 50
+        session.close()
+        storage.close_all_engines()
+
+    def test_close_all_engines_drains_no_wait_queue(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        for i in range(20):
+            storage.submit_log(
+                "test", db_path, wait=False,
+                student_id="s1", experiment="test", func_name="f", args=[i],
+            )
+        storage.close_all_engines()
+        session = storage.get_session("test", db_path)
+        assert storage.count_logs(session) == 20
+        session.close()
+        storage.close_all_engines()
+
+
 # ── Log Query Filters ──
 
 
@@ -486,6 +614,13 @@ class TestLogQueryPagination:
     def test_empty_db_query(self, db_session):
         assert storage.query_logs(db_session) == []
 
+    def test_iter_logs_unbounded(self, db_session):
+        for i in range(150):
+            storage.add_log(db_session, student_id="s001", experiment="t", func_name="f", args=[i])
+        logs = list(storage.iter_logs(db_session, n=None, order="earliest", yield_per=40))
+        assert len(logs) == 150
+        assert [log["args"] for log in logs] == [[i] for i in range(150)]
+
 
 # ── Log Options ──
 
@@ -558,6 +693,66 @@ class TestLogToDict:
         assert ts.endswith("Z")
         assert "T" in ts
 
+    def test_payload_round_trip(self, db_session):
+        storage.add_log(
+            db_session,
+            student_id="s001", experiment="t", func_name="f",
+            args=[2**70 + 1, {1: "a"}], result={"when": datetime(2024, 1, 1)},
+        )
+        log = storage.query_logs(db_session)[0]
+        assert log["args"] == [2**70 + 1, {"1": "a"}]
+        assert log["result"] == {"when": "2024-01-01 00:00:00"}
+
+    def test_non_finite_payload_round_trip(self, db_session):
+        storage.add_log(
+            db_session,
+            student_id="s001", experiment="t", func_name="f",
+            args=[float("inf"), None, {"x": -math.inf}], result=float("nan"),
+        )
+        log = storage.query_logs(db_session)[0]
+        assert log["args"] == [math.inf, None, {"x": -math.inf}]
+        assert math.isnan(log["result"])
+
+    def test_ints_just_outside_64_bits_round_trip(self, db_session):
+        edges = [-2**63 - 1, 2**64, -2**63, 2**64 - 1]
+        storage.add_log(db_session, student_id="s001", experiment="t", func_name="f", args=edges, result=edges[0])
+        log = storage.query_logs(db_session)[0]
+        assert log["args"] == edges
+        assert log["result"] == -2**63 - 1
+
+    def test_numpy_payload_logged_as_numbers(self, db_session):
+        np = pytest.importorskip("numpy")
+        storage.add_log(
+            db_session,
+            student_id="s001", experiment="t", func_name="f",
+            args=[np.arange(3)], result=np.float64(1.5),
+        )
+        log = storage.query_logs(db_session)[0]
+        assert log["args"] == [[0, 1, 2]]
+        assert log["result"] == 1.5
+
+    def test_raw_json_encodes_like_parsed(self, db_session):
+        storage.add_log(
+            db_session,
+            student_id="s001", experiment="t", func_name="f",
+            args=[1, {"x": [2.5, None]}], result="ok",
+        )
+        storage.add_log(db_session, student_id="s001", experiment="t", func_name="f", args=[])
+        raw = storage.query_logs(db_session, raw_json=True)
+        assert isinstance(raw[0]["args"], orjson.Fragment)
+        assert orjson.loads(orjson.dumps(raw)) == storage.query_logs(db_session)
+
+    def test_raw_json_parses_legacy_nan_rows(self, db_session):
+        storage.add_log(db_session, student_id="s001", experiment="t", func_name="f", args=[])
+        db_session.execute(storage.Log.__table__.update().values(args_json="[NaN]"))
+        db_session.commit()
+        raw = storage.query_logs(db_session, raw_json=True)
+        assert orjson.loads(orjson.dumps(raw))[0]["args"] == [None]
+
+    def test_parse_legacy_nan(self):
+        assert math.isnan(storage._parse_json_safe("[NaN]")[0])
+        assert storage._parse_json_safe("not json") == "not json"
+
 
 # ── Engine management ──
 
@@ -576,6 +771,21 @@ class TestEngineManagement:
         session2.close()
         storage.close_all_engines()
 
+    def test_checkpoint_threshold_applied(self, db_session):
+        from sqlalchemy import text
+        value = db_session.execute(text("SELECT current_setting('checkpoint_threshold')")).scalar()
+        assert value.startswith("61")  # 64MB reported in MiB
+
+    def test_session_factory_cached(self, tmp_path):
+        db_path = tmp_path / "db" / "test.db"
+        db_path.parent.mkdir(parents=True)
+        f1 = storage.get_session_factory("test", db_path)
+        f2 = storage.get_session_factory("test", db_path)
+        assert f1 is f2
+        storage.close_all_engines()
+        assert storage.get_session_factory("test", db_path) is not f1
+        storage.close_all_engines()
+
     def test_multiple_experiments_separate_dbs(self, tmp_path):
         db1 = tmp_path / "exp1" / "db" / "experiment.db"
         db2 = tmp_path / "exp2" / "db" / "experiment.db"